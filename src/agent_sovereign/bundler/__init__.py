@@ -9,6 +9,7 @@ Submodules
 - ``manifest``         BundleManifest, BundleComponent, SovereigntyLevel enum
 - ``docker_generator`` DockerGenerator for Dockerfile / Compose generation
 - ``packager``         AgentPackager — scans sources, computes checksums
+- ``hashing``          file_checksum — SHA-256 / optional BLAKE3 file digests
 - ``attestation``      AttestationGenerator — build provenance and integrity
 """
 from __future__ import annotations
@@ -28,6 +29,7 @@ from agent_sovereign.bundler.dependency_resolver import (
     DependencyConflictError,
     DependencyResolver,
 )
+from agent_sovereign.bundler.hashing import SUPPORTED_HASH_ALGORITHMS, file_checksum
 from agent_sovereign.bundler.full_stack import (
     AumOSComponent,
     FullStackBundle,
@@ -46,6 +48,9 @@ __all__ = [
     # Packager
     "AgentPackager",
     "PackageConfig",
+    # Hashing
+    "SUPPORTED_HASH_ALGORITHMS",
+    "file_checksum",
     # Attestation
     "Attestation",
     "AttestationGenerator",
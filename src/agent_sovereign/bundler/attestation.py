@@ -20,7 +20,9 @@ from __future__ import annotations
 
 import datetime
 import hashlib
+import hmac
 import json
+import math
 import platform
 import secrets
 import sys
@@ -30,6 +32,13 @@ from pathlib import Path
 
 from agent_sovereign.bundler.manifest import BundleManifest
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the optional extra
+    _HAS_ORJSON = False
+
 
 # ---------------------------------------------------------------------------
 # Attestation type enum
@@ -234,28 +243,44 @@ class AttestationGenerator:
             ``True`` if the recomputed signature matches the stored one
             and all required fields are present.  ``False`` otherwise.
         """
-        if attestation.signature is None:
-            return False
+        return self.verify_attestations([attestation])[0]
 
-        if not attestation.attestation_id:
-            return False
-        if not attestation.subject:
-            return False
-        if not attestation.issuer:
-            return False
+    def verify_attestations(self, attestations: list[Attestation]) -> list[bool]:
+        """Verify a batch of attestations.
 
-        expected_signature = self._sign_claims(attestation.claims)
+        Applies the same checks as :meth:`verify_attestation` to every
+        attestation.  Each comparison uses :func:`hmac.compare_digest`,
+        so it runs in constant time and one failure never short-circuits
+        the rest of the batch.
 
-        # Constant-time comparison to resist timing attacks
-        sig_a = attestation.signature.encode("utf-8")
-        sig_b = expected_signature.encode("utf-8")
-        if len(sig_a) != len(sig_b):
-            return False
+        Parameters
+        ----------
+        attestations:
+            The Attestations to verify.
 
-        result = 0
-        for byte_a, byte_b in zip(sig_a, sig_b):
-            result |= byte_a ^ byte_b
-        return result == 0
+        Returns
+        -------
+        list[bool]
+            One result per attestation, in input order.
+        """
+        results: list[bool] = []
+        for attestation in attestations:
+            if (
+                attestation.signature is None
+                or not attestation.attestation_id
+                or not attestation.subject
+                or not attestation.issuer
+            ):
+                results.append(False)
+                continue
+            expected_signature = self._sign_claims(attestation.claims)
+            results.append(
+                hmac.compare_digest(
+                    attestation.signature.encode("utf-8"),
+                    expected_signature.encode("utf-8"),
+                )
+            )
+        return results
 
     def export_attestations(
         self,
@@ -264,6 +289,14 @@ class AttestationGenerator:
     ) -> None:
         """Write a list of attestations to a JSON file.
 
+        Uses ``orjson`` when the optional ``fast-json`` extra is installed
+        and every value is a plain JSON type (see :func:`_is_plain_json`),
+        and the standard library with ``default=str`` otherwise, writing
+        two-space-indented JSON either way.  Anything orjson would encode
+        differently (datetimes, enums, NaN, integers wider than 64 bits)
+        takes the standard-library path, so exported claims still verify
+        after import.
+
         Parameters
         ----------
         attestations:
@@ -274,6 +307,9 @@ class AttestationGenerator:
         records: list[dict[str, object]] = [
             _attestation_to_dict(att) for att in attestations
         ]
+        if _HAS_ORJSON and _is_plain_json(records):
+            path.write_bytes(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+            return
         path.write_text(
             json.dumps(records, indent=2, default=str),
             encoding="utf-8",
@@ -303,6 +339,9 @@ class AttestationGenerator:
             raise FileNotFoundError(
                 f"Attestation file not found: {path}"
             )
+        # Parsed with the standard library even when orjson is installed:
+        # orjson.loads silently turns integers outside the 64-bit range into
+        # floats, which would change the claims and break verification.
         raw = json.loads(path.read_text(encoding="utf-8"))
         return [_attestation_from_dict(record) for record in raw]
 
@@ -330,8 +369,7 @@ class AttestationGenerator:
         str
             Lowercase hex SHA-256 digest of the canonical payload.
         """
-        payload = json.dumps(claims, sort_keys=True, separators=(",", ":"), default=str)
-        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return hashlib.sha256(_canonical_claims(claims)).hexdigest()
 
 
 # ---------------------------------------------------------------------------
@@ -339,6 +377,41 @@ class AttestationGenerator:
 # ---------------------------------------------------------------------------
 
 
+def _canonical_claims(claims: dict[str, object]) -> bytes:
+    """Serialise *claims* to canonical UTF-8 JSON bytes.
+
+    Keys are sorted and separators carry no whitespace.  Signing and
+    verification both go through this helper, so a payload is encoded
+    exactly once and the same bytes are hashed on either side.
+    """
+    return json.dumps(
+        claims, sort_keys=True, separators=(",", ":"), default=str
+    ).encode("utf-8")
+
+
+def _is_plain_json(value: object) -> bool:
+    """Return whether orjson encodes *value* exactly as ``json.dumps`` would.
+
+    True for ``str``, ``bool``, ``None``, integers in orjson's 64-bit range,
+    finite floats, and lists, tuples and str-keyed dicts of those.  Exact
+    types are required: subclasses such as enums go through ``default=str``
+    on the standard-library path.
+    """
+    if value is None or type(value) is str or type(value) is bool:
+        return True
+    if type(value) is int:
+        return -(1 << 63) <= value < 1 << 64
+    if type(value) is float:
+        return math.isfinite(value)
+    if type(value) is list or type(value) is tuple:
+        return all(_is_plain_json(item) for item in value)
+    if type(value) is dict:
+        return all(
+            type(key) is str and _is_plain_json(item) for key, item in value.items()
+        )
+    return False
+
+
 def _attestation_to_dict(attestation: Attestation) -> dict[str, object]:
     """Convert an Attestation dataclass to a JSON-serialisable dict."""
     return {
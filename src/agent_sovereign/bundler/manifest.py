@@ -13,22 +13,31 @@ Classes
 from __future__ import annotations
 
 import datetime
-import hashlib
 import json
+import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from operator import attrgetter
 from pathlib import Path
+from typing import ClassVar
 
 from pydantic import BaseModel, Field, computed_field
 
+from agent_sovereign.bundler.hashing import HashAlgorithm, file_checksum
+
+# Upper bound on hashing threads used by verify_checksums.  hashlib releases
+# the GIL while digesting, so threads scale until disk bandwidth saturates.
+_MAX_HASH_WORKERS: int = 8
+
 
 # ---------------------------------------------------------------------------
 # Value objects
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BundleComponent:
     """A single component included in a deployment bundle.
 
@@ -44,7 +53,8 @@ class BundleComponent:
     size_bytes:
         File size in bytes.
     checksum:
-        SHA-256 hex digest of the file content, used for integrity verification.
+        Hex digest of the file content (algorithm recorded on the owning
+        manifest), used for integrity verification.
     """
 
     name: str
@@ -53,7 +63,7 @@ class BundleComponent:
     size_bytes: int
     checksum: str
 
-    _VALID_TYPES: frozenset[str] = frozenset(
+    _VALID_TYPES: ClassVar[frozenset[str]] = frozenset(
         {"model", "agent_code", "config", "policy", "data"}
     )
 
@@ -129,6 +139,9 @@ class BundleManifest(BaseModel):
         Ordered list of BundleComponent records.
     metadata:
         Free-form key/value pairs for environment-specific annotations.
+    hash_algorithm:
+        Digest algorithm used for every component checksum —
+        ``"sha256"`` (default) or ``"blake3"``.
     """
 
     bundle_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -139,6 +152,7 @@ class BundleManifest(BaseModel):
     target_platform: str
     components: list[BundleComponent] = Field(default_factory=list)
     metadata: dict[str, object] = Field(default_factory=dict)
+    hash_algorithm: HashAlgorithm = "sha256"
 
     model_config = {"arbitrary_types_allowed": True}
 
@@ -169,13 +183,36 @@ class BundleManifest(BaseModel):
         ValueError
             If a component with the same name already exists.
         """
+        self.add_components([component])
+
+    def add_components(self, components: list[BundleComponent]) -> None:
+        """Add several components, checking name uniqueness in one pass.
+
+        The set of existing names is built once for the whole batch, so
+        adding *n* components costs O(n) rather than the O(n²) of
+        repeated :meth:`add_component` calls.  Components before the
+        first duplicate are kept.
+
+        Parameters
+        ----------
+        components:
+            The BundleComponents to add, in order.
+
+        Raises
+        ------
+        ValueError
+            If a component's name duplicates an existing component or an
+            earlier component in the batch.
+        """
         existing_names = {c.name for c in self.components}
-        if component.name in existing_names:
-            raise ValueError(
-                f"A component named {component.name!r} already exists in this manifest. "
-                "Remove it first or use a unique name."
-            )
-        self.components.append(component)
+        for component in components:
+            if component.name in existing_names:
+                raise ValueError(
+                    f"A component named {component.name!r} already exists in this manifest. "
+                    "Remove it first or use a unique name."
+                )
+            existing_names.add(component.name)
+            self.components.append(component)
 
     def remove_component(self, name: str) -> None:
         """Remove a component by name.
@@ -207,7 +244,7 @@ class BundleManifest(BaseModel):
         int
             Total bytes across all BundleComponent entries.
         """
-        return sum(c.size_bytes for c in self.components)
+        return sum(map(attrgetter("size_bytes"), self.components))
 
     # ------------------------------------------------------------------
     # Serialisation
@@ -281,7 +318,11 @@ class BundleManifest(BaseModel):
         """Verify all component checksums against files on disk.
 
         For each BundleComponent, resolve ``base_path / component.path``,
-        compute its SHA-256 digest, and compare it to the stored checksum.
+        compute its digest with :attr:`hash_algorithm`, and compare it to
+        the stored checksum.  Files whose size differs from
+        ``size_bytes`` fail without being hashed.  Manifests with two or more components are
+        hashed concurrently on a small thread pool; results keep the
+        manifest's component order.
 
         Parameters
         ----------
@@ -292,49 +333,28 @@ class BundleManifest(BaseModel):
         -------
         list[tuple[str, bool]]
             A list of ``(component_name, is_valid)`` pairs — one per
-            component.  ``is_valid`` is ``False`` if the file is missing
-            or its digest does not match.
+            component.  ``is_valid`` is ``False`` if the file is missing,
+            its size differs, or its digest does not match.
         """
-        results: list[tuple[str, bool]] = []
-        for component in self.components:
-            file_path = base_path / component.path
-            if not file_path.exists():
-                results.append((component.name, False))
-                continue
-            digest = _sha256_file(file_path)
-            results.append((component.name, digest == component.checksum))
-        return results
-
-
-# ---------------------------------------------------------------------------
-# Internal helpers
-# ---------------------------------------------------------------------------
-
 
-def _sha256_file(file_path: Path) -> str:
-    """Compute the SHA-256 hex digest of a file.
-
-    Reads in 64 KiB chunks to keep memory usage low for large model files.
-
-    Parameters
-    ----------
-    file_path:
-        Absolute or relative path to the file.
-
-    Returns
-    -------
-    str
-        Lowercase hex SHA-256 digest string.
-    """
-    hasher = hashlib.sha256()
-    chunk_size = 65_536
-    with file_path.open("rb") as fh:
-        while True:
-            chunk = fh.read(chunk_size)
-            if not chunk:
-                break
-            hasher.update(chunk)
-    return hasher.hexdigest()
+        def _verify(component: BundleComponent) -> tuple[str, bool]:
+            file_path = base_path / component.path
+            try:
+                size = file_path.stat().st_size
+            except FileNotFoundError:
+                return (component.name, False)
+            # A size change already proves the content differs; skip hashing.
+            if size != component.size_bytes:
+                return (component.name, False)
+            digest = file_checksum(file_path, self.hash_algorithm)
+            return (component.name, digest == component.checksum)
+
+        if len(self.components) < 2:
+            return [_verify(component) for component in self.components]
+
+        max_workers = min(_MAX_HASH_WORKERS, os.cpu_count() or 1, len(self.components))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_verify, self.components))
 
 
 __all__ = [
@@ -5,10 +5,15 @@ It:
 
 1. Walks the source directory recursively.
 2. Classifies each file as one of the known component types.
-3. Computes SHA-256 checksums for all included files.
+3. Computes checksums (SHA-256 by default) for all included files.
 4. Constructs a BundleManifest.
 5. Validates the resulting manifest for completeness.
 
+File contents are read exactly once, by the checksum pass; the packager
+records components in place and never copies or compresses them.  A
+later pipeline step that stages files should hash while it copies
+rather than re-reading the manifest's sources.
+
 Classes
 -------
 - PackageConfig   Frozen dataclass of packaging options.
@@ -16,17 +21,22 @@ Classes
 """
 from __future__ import annotations
 
-import hashlib
 import os
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from agent_sovereign.bundler.hashing import HashAlgorithm, file_checksum
 from agent_sovereign.bundler.manifest import (
     BundleComponent,
     BundleManifest,
     BundleSovereigntyLevel,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
 
 # ---------------------------------------------------------------------------
 # Component-type heuristics
@@ -57,6 +67,13 @@ _EXTENSION_TYPE_MAP: list[tuple[frozenset[str], str]] = [
     ),
 ]
 
+# Flattened suffix -> component_type lookup built once from the map above.
+_SUFFIX_TYPE: dict[str, str] = {
+    suffix: component_type
+    for extensions, component_type in _EXTENSION_TYPE_MAP
+    for suffix in extensions
+}
+
 # Directories that are always excluded from scanning.
 _EXCLUDED_DIRS: frozenset[str] = frozenset(
     {
@@ -76,6 +93,9 @@ _EXCLUDED_DIRS: frozenset[str] = frozenset(
     }
 )
 
+# Directories holding test suites, excluded unless include_tests is set.
+_TEST_DIRS: frozenset[str] = frozenset({"tests", "test"})
+
 # File names that are always excluded.
 _EXCLUDED_FILES: frozenset[str] = frozenset(
     {
@@ -87,6 +107,13 @@ _EXCLUDED_FILES: frozenset[str] = frozenset(
     }
 )
 
+# Compiled-bytecode suffixes that are never bundled (str.endswith tuple).
+_EXCLUDED_SUFFIXES: tuple[str, ...] = (".pyc", ".pyo")
+
+# C-level accessors: summing component sizes and sorting directory entries.
+_SIZE_BYTES = attrgetter("size_bytes")
+_ENTRY_NAME = attrgetter("name")
+
 
 # ---------------------------------------------------------------------------
 # Configuration value object
@@ -112,12 +139,16 @@ class PackageConfig:
         Reserved flag — indicates the caller intends to compress the
         bundle after packaging.  The packager itself does not perform
         compression; that is a separate pipeline step.
+    hash_algorithm:
+        Digest used for component checksums.  ``"sha256"`` (default) or
+        ``"blake3"`` (requires the optional ``blake3`` package).
     """
 
     output_dir: Path
     include_model: bool = True
     include_tests: bool = False
     compress: bool = False
+    hash_algorithm: HashAlgorithm = "sha256"
 
 
 # ---------------------------------------------------------------------------
@@ -189,9 +220,9 @@ class AgentPackager:
             sovereignty_level=sovereignty_level,
             target_platform=target_platform,
             metadata=dict(metadata) if metadata else {},
+            hash_algorithm=self._config.hash_algorithm,
         )
-        for component in components:
-            manifest.add_component(component)
+        manifest.add_components(components)
 
         return manifest
 
@@ -206,75 +237,71 @@ class AgentPackager:
         Returns
         -------
         list[BundleComponent]
-            Components sorted by their relative path string, one per
-            discovered file.  Test files are excluded when
+            One component per discovered file: each directory's files in
+            name order, followed by its subdirectories in name order.
+            Test files are excluded when
             ``config.include_tests`` is ``False``.  Model files are
             excluded when ``config.include_model`` is ``False``.
         """
         components: list[BundleComponent] = []
 
-        for root_str, dir_names, file_names in os.walk(path):
-            root = Path(root_str)
-
-            # Prune excluded directories in-place (modifies the walk)
-            dir_names[:] = [
-                d for d in dir_names if d not in _EXCLUDED_DIRS
-            ]
-
-            # Skip test directories unless explicitly included
-            if not self._config.include_tests:
-                dir_names[:] = [
-                    d for d in dir_names if d not in {"tests", "test"}
-                ]
-
-            for file_name in sorted(file_names):
-                if file_name in _EXCLUDED_FILES:
-                    continue
-
-                file_path = root / file_name
-                relative = file_path.relative_to(path)
-
-                # Exclude test files by name pattern
-                if not self._config.include_tests and _is_test_file(file_name):
-                    continue
-
-                component_type = _classify_file(file_path)
-
-                # Respect model inclusion flag
-                if component_type == "model" and not self._config.include_model:
-                    continue
-
-                size = file_path.stat().st_size
-                checksum = self.compute_checksum(file_path)
-                name = _derive_component_name(relative)
-
-                components.append(
-                    BundleComponent(
-                        name=name,
-                        component_type=component_type,
-                        path=str(relative).replace("\\", "/"),
-                        size_bytes=size,
-                        checksum=checksum,
-                    )
+        # Test directories are pruned alongside the always-excluded ones
+        # unless explicitly included.
+        pruned_dirs = (
+            _EXCLUDED_DIRS
+            if self._config.include_tests
+            else _EXCLUDED_DIRS | _TEST_DIRS
+        )
+
+        for relative, entry in _walk_files(os.fspath(path), "", pruned_dirs):
+            file_name = entry.name
+            if file_name in _EXCLUDED_FILES or file_name.endswith(_EXCLUDED_SUFFIXES):
+                continue
+
+            # Exclude test files by name pattern
+            if not self._config.include_tests and _is_test_file(file_name):
+                continue
+
+            component_type = _classify_file(file_name)
+
+            # Respect model inclusion flag
+            if component_type == "model" and not self._config.include_model:
+                continue
+
+            # DirEntry.stat() caches its result; the file is known to exist
+            # so hash it directly rather than via compute_checksum's check.
+            size = entry.stat().st_size
+            checksum = file_checksum(Path(entry.path), self._config.hash_algorithm)
+
+            components.append(
+                BundleComponent(
+                    name=_derive_component_name(relative),
+                    component_type=component_type,
+                    path=relative,
+                    size_bytes=size,
+                    checksum=checksum,
                 )
+            )
 
         return components
 
     @staticmethod
-    def compute_checksum(file_path: Path) -> str:
-        """Compute the SHA-256 hex digest of a file.
-
-        Reads in 64 KiB chunks for memory efficiency with large model files.
+    def compute_checksum(
+        file_path: Path, algorithm: HashAlgorithm = "sha256"
+    ) -> str:
+        """Compute the hex digest of a file.
 
         Parameters
         ----------
         file_path:
             Path to the file.
+        algorithm:
+            ``"sha256"`` (default) or ``"blake3"``.
 
         Returns
         -------
         str
-            Lowercase hex SHA-256 digest.
+            Lowercase 64-character hex digest.
 
         Raises
         ------
@@ -285,31 +312,24 @@ class AgentPackager:
             raise FileNotFoundError(
                 f"Cannot compute checksum: file not found: {file_path}"
             )
-        hasher = hashlib.sha256()
-        chunk_size = 65_536
-        with file_path.open("rb") as fh:
-            while True:
-                chunk = fh.read(chunk_size)
-                if not chunk:
-                    break
-                hasher.update(chunk)
-        return hasher.hexdigest()
+        return file_checksum(file_path, algorithm)
 
     @staticmethod
-    def estimate_bundle_size(components: list[BundleComponent]) -> int:
+    def estimate_bundle_size(components: Iterable[BundleComponent]) -> int:
         """Sum the size_bytes of all components.
 
         Parameters
         ----------
         components:
-            List of BundleComponent instances.
+            BundleComponent instances; any iterable, so callers can pass
+            a generator without materialising a list.
 
         Returns
         -------
         int
             Total estimated size of the bundle in bytes.
         """
-        return sum(c.size_bytes for c in components)
+        return sum(map(_SIZE_BYTES, components))
 
     def validate_bundle(
         self, manifest: BundleManifest, output_dir: Path
@@ -323,7 +343,7 @@ class AgentPackager:
         - Manifest has a non-empty target_platform.
         - No duplicate component names.
         - No duplicate component paths.
-        - All component checksums are 64 hex characters (SHA-256).
+        - All component checksums are 64 hex characters.
         - All component sizes are non-negative.
         - output_dir exists (or is creatable).
 
@@ -391,15 +411,15 @@ class AgentPackager:
 # ---------------------------------------------------------------------------
 
 
-def _classify_file(file_path: Path) -> str:
+def _classify_file(file_name: str) -> str:
     """Return the component_type string for a given file.
 
     Defaults to ``"data"`` if no extension matches a known type.
 
     Parameters
     ----------
-    file_path:
-        Path to the file being classified.
+    file_name:
+        Bare name of the file being classified.
 
     Returns
     -------
@@ -407,11 +427,7 @@ def _classify_file(file_path: Path) -> str:
         One of: ``"model"``, ``"agent_code"``, ``"config"``,
         ``"policy"``, ``"data"``.
     """
-    suffix = file_path.suffix.lower()
-    for extensions, component_type in _EXTENSION_TYPE_MAP:
-        if suffix in extensions:
-            return component_type
-    return "data"
+    return _SUFFIX_TYPE.get(os.path.splitext(file_name)[1].lower(), "data")
 
 
 def _is_test_file(file_name: str) -> bool:
@@ -432,7 +448,7 @@ def _is_test_file(file_name: str) -> bool:
     return lower.startswith("test_") or lower.endswith("_test.py")
 
 
-def _derive_component_name(relative: Path) -> str:
+def _derive_component_name(relative: str) -> str:
     """Derive a unique, human-readable component name from a relative path.
 
     Uses the file stem (name without extension) joined with parent path
@@ -441,20 +457,55 @@ def _derive_component_name(relative: Path) -> str:
     Parameters
     ----------
     relative:
-        Relative path of the file inside the bundle.
+        ``/``-separated relative path of the file inside the bundle.
 
     Returns
     -------
     str
         A slash-separated name string, e.g. ``"models/llama-3-8b"``.
     """
-    parts = list(relative.parts)
-    if not parts:
+    if not relative:
         return "unknown"
-    # Strip the extension from the final segment
-    stem = Path(parts[-1]).stem
-    parts[-1] = stem
-    return "/".join(parts)
+    return os.path.splitext(relative)[0]
+
+
+def _walk_files(
+    directory: str, prefix: str, pruned_dirs: frozenset[str]
+) -> Iterator[tuple[str, os.DirEntry[str]]]:
+    """Yield ``(relative_path, entry)`` for every file below *directory*.
+
+    Built on :func:`os.scandir` so file-type checks come from the
+    directory listing itself and each entry's ``stat()`` result is cached.
+    Directories named in *pruned_dirs* are never descended into, and
+    symlinked directories are not followed (matching ``os.walk``).
+
+    Parameters
+    ----------
+    directory:
+        Directory to list.
+    prefix:
+        ``/``-terminated relative path of *directory* (``""`` for the root).
+    pruned_dirs:
+        Directory names to skip entirely.
+
+    Yields
+    ------
+    tuple[str, os.DirEntry[str]]
+        The ``/``-separated path relative to the scan root and the entry.
+    """
+    with os.scandir(directory) as it:
+        entries = sorted(it, key=_ENTRY_NAME)
+
+    subdirs: list[os.DirEntry[str]] = []
+    for entry in entries:
+        if entry.is_dir():
+            if entry.name not in pruned_dirs and not entry.is_symlink():
+                subdirs.append(entry)
+        else:
+            yield prefix + entry.name, entry
+
+    for entry in subdirs:
+        yield from _walk_files(entry.path, f"{prefix}{entry.name}/", pruned_dirs)
 
 
 def _is_hex(value: str) -> bool:
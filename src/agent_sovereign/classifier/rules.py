@@ -6,6 +6,7 @@ sovereignty levels.
 """
 from __future__ import annotations
 
+import functools
 import io
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -59,7 +60,7 @@ rules:
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassificationRule:
     """A single classification rule loaded from YAML."""
 
@@ -120,6 +121,36 @@ class RuleMatchResult:
     """Human-readable reasons from each matched rule."""
 
 
+# Immutable snapshot of one parsed rule:
+# (rule_id, description, minimum_level, data_types, regulations, geographies).
+_RuleSpec = tuple[str, str, int, tuple[str, ...], tuple[str, ...], tuple[str, ...]]
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_rules_yaml(yaml_text: str) -> tuple[_RuleSpec, ...]:
+    """Parse rules YAML into immutable rule specs, memoised on the text.
+
+    YAML parsing dominates engine construction, and most engines are built
+    from the same text (the embedded defaults), so the parsed form is
+    cached.  Keying on the text rather than a file path means an edited
+    rules file is always re-parsed.
+    """
+    data = yaml.safe_load(io.StringIO(yaml_text))
+    if not isinstance(data, dict) or "rules" not in data:
+        raise ValueError("Rules YAML must have a top-level 'rules' key.")
+    return tuple(
+        (
+            rule_dict["id"],
+            rule_dict.get("description", ""),
+            int(rule_dict["minimum_level"]),
+            tuple(rule_dict.get("data_types", [])),
+            tuple(rule_dict.get("regulations", [])),
+            tuple(rule_dict.get("geographies", [])),
+        )
+        for rule_dict in data["rules"]
+    )
+
+
 class ClassificationRules:
     """YAML-based rule engine for sovereignty classification.
 
@@ -156,18 +187,19 @@ class ClassificationRules:
         self._load_from_string(content)
 
     def _load_from_string(self, yaml_text: str) -> None:
-        data = yaml.safe_load(io.StringIO(yaml_text))
-        if not isinstance(data, dict) or "rules" not in data:
-            raise ValueError("Rules YAML must have a top-level 'rules' key.")
-        for rule_dict in data["rules"]:
+        # Each engine gets its own rule objects (and lists) so that mutating
+        # one engine's rules never leaks into another built from the same YAML.
+        for rule_id, description, minimum_level, data_types, regulations, geographies in (
+            _parse_rules_yaml(yaml_text)
+        ):
             self._rules.append(
                 ClassificationRule(
-                    rule_id=rule_dict["id"],
-                    description=rule_dict.get("description", ""),
-                    minimum_level=int(rule_dict["minimum_level"]),
-                    data_types=rule_dict.get("data_types", []),
-                    regulations=rule_dict.get("regulations", []),
-                    geographies=rule_dict.get("geographies", []),
+                    rule_id=rule_id,
+                    description=description,
+                    minimum_level=minimum_level,
+                    data_types=list(data_types),
+                    regulations=list(regulations),
+                    geographies=list(geographies),
                 )
             )
 
@@ -2,14 +2,32 @@
 
 Provides regex-based PII/PHI/classified data detection and a mapping of
 data types to sovereignty level scores.
+
+When the optional ``hyperscan`` package is installed
+(``pip install agent-sovereign[hyperscan]``), ASCII text is first matched
+against all built-in patterns in one Hyperscan pass, and only the patterns
+it reports are run through :mod:`re` to count matches.
 """
 from __future__ import annotations
 
+import functools
 import re
+import string
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 from agent_sovereign.classifier.levels import SovereigntyLevel
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+try:
+    import hyperscan  # type: ignore[import-not-found]
+
+    _HAS_HYPERSCAN = True
+except ImportError:  # pragma: no cover - depends on the optional extra
+    _HAS_HYPERSCAN = False
+
 # Maps data type keys to minimum sovereignty level scores.
 # Higher scores mean more sensitive data requiring a higher sovereignty level.
 DATA_SENSITIVITY: dict[str, int] = {
@@ -29,15 +47,22 @@ DATA_SENSITIVITY: dict[str, int] = {
     "sci_compartmented": 7,
 }
 
+_EMAIL_PATTERN: re.Pattern[str] = re.compile(
+    r"\b[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}\b"
+)
+
+# Visa, Mastercard, Amex, Discover card numbers (simplified Luhn-format).
+# Candidates only count when they also pass the Luhn checksum (_luhn_ok).
+_CARD_NUMBER_PATTERN: re.Pattern[str] = re.compile(
+    r"\b(?:4\d{12}(?:\d{3})?|5[1-5]\d{14}|3[47]\d{13}|6011\d{12})\b"
+)
+
 # Regex patterns for each detectable data type.
 # Each entry is a list of compiled patterns; a match on ANY pattern triggers detection.
 _DETECTION_PATTERNS: dict[str, list[re.Pattern[str]]] = {
-    "customer_email": [
-        re.compile(r"\b[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}\b"),
-    ],
+    "customer_email": [_EMAIL_PATTERN],
     "pci_card_data": [
-        # Visa, Mastercard, Amex, Discover card numbers (simplified Luhn-format)
-        re.compile(r"\b(?:4\d{12}(?:\d{3})?|5[1-5]\d{14}|3[47]\d{13}|6011\d{12})\b"),
+        _CARD_NUMBER_PATTERN,
         re.compile(r"\bcard(?:holder|number|num)\b", re.IGNORECASE),
         re.compile(r"\bcvv\b|\bcvc\b|\bcvv2\b", re.IGNORECASE),
     ],
@@ -93,9 +118,325 @@ _DETECTION_PATTERNS: dict[str, list[re.Pattern[str]]] = {
 }
 
 
-@dataclass
+# Single-pass prefilter over the built-in patterns, matched against the
+# lowercased text.  Most scanned text contains nothing sensitive; one search
+# over the union settles that case instead of running each pattern in turn.
+# When it does match, no gated pattern can match before the reported
+# position, so the per-pattern pass starts there.
+#
+# The union is compiled case-sensitively: every IGNORECASE built-in is
+# written in lowercase, and the case-sensitive ones (card number, SSN)
+# match lowercased text exactly as they match the original.  This only
+# holds for ASCII input, where lowercasing preserves length and offsets.
+# It is also compiled with re.ASCII, whose \w and \b checks are cheaper
+# than the Unicode ones and agree with them on ASCII text.  re.ASCII's \s
+# leaves out the separators \x1c-\x1f, so those are mapped to spaces first
+# (_SEPARATORS_TO_SPACE); both are non-word whitespace, so \b is unaffected.
+#
+# Email is left out and always counted from the start of the text: its
+# count is linear-time (_count_emails), whereas as a union branch it would
+# rescan each run of local-part characters once per word boundary in it.
+_UNGATED_TYPES: frozenset[str] = frozenset({"customer_email"})
+_BUILTIN_PREFILTER: re.Pattern[str] = re.compile(
+    "|".join(
+        f"(?:{pattern.pattern})"
+        for data_type, patterns in _DETECTION_PATTERNS.items()
+        if data_type not in _UNGATED_TYPES
+        for pattern in patterns
+    ),
+    re.ASCII,
+)
+
+# ASCII separators that Unicode str patterns treat as \s but re.ASCII and
+# Hyperscan (PCRE) do not.
+_SEPARATORS_TO_SPACE: dict[int, int] = str.maketrans("\x1c\x1d\x1e\x1f", "    ")
+
+
+# Built-in patterns in data-type order, so scans collect evidence already
+# sorted and only need to sort when custom types are merged in.
+_ORDERED_PATTERNS: dict[str, list[re.Pattern[str]]] = dict(sorted(_DETECTION_PATTERNS.items()))
+
+# Case-sensitive re.ASCII twins of the built-in patterns for the per-pattern
+# pass over lowercased ASCII text, under the same invariants as the
+# prefilter.  Matching lowercase literals skips the per-character case
+# folding of IGNORECASE; the source strings are unchanged, so evidence lines
+# are identical.
+_LOWERCASE_PATTERNS: dict[str, list[re.Pattern[str]]] = {
+    data_type: [
+        re.compile(
+            pattern.pattern, pattern.flags & ~(re.IGNORECASE | re.UNICODE) | re.ASCII
+        )
+        for pattern in patterns
+    ]
+    for data_type, patterns in _ORDERED_PATTERNS.items()
+}
+
+
+def _without_leading_boundary(source: str) -> str | None:
+    """Return *source* with the ``\\b`` that opens each top-level branch removed.
+
+    Returns ``None`` unless every top-level branch opens with ``\\b``
+    followed by a group or a literal word character, the shapes where sre
+    regains its literal-prefix search once the assertion is gone.
+    """
+    branches: list[str] = []
+    branch_start = 0
+    depth = 0
+    in_class = escaped = False
+    for index, char in enumerate(source):
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            branches.append(source[branch_start:index])
+            branch_start = index + 1
+    branches.append(source[branch_start:])
+
+    stripped: list[str] = []
+    for branch in branches:
+        rest = branch[2:]
+        if not branch.startswith("\\b") or not rest or not (rest[0] == "(" or rest[0].isalnum()):
+            return None
+        stripped.append(rest)
+    return "|".join(stripped)
+
+
+# A leading \b hides a pattern's literal prefix from sre, which then tries a
+# full match at every position.  For twins whose every branch opens with
+# \b, this maps the twin to a copy without it; _count_matches finds that
+# copy's candidates with sre's fast prefix search and checks the boundary
+# itself, giving the same count as the twin's findall.
+_UNBOUNDED_TWINS: dict[re.Pattern[str], re.Pattern[str]] = {
+    pattern: re.compile(unbounded, pattern.flags)
+    for patterns in _LOWERCASE_PATTERNS.values()
+    for pattern in patterns
+    if (unbounded := _without_leading_boundary(pattern.pattern)) is not None
+}
+
+# Luhn digit values for the doubled positions: 2d, minus 9 when that exceeds 9.
+_LUHN_DOUBLED: tuple[int, ...] = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+
+def _luhn_ok(digits: str) -> bool:
+    """Return whether the digit string *digits* passes the Luhn checksum."""
+    total = sum(map(int, digits[-1::-2]))
+    total += sum(_LUHN_DOUBLED[int(digit)] for digit in digits[-2::-2])
+    return total % 10 == 0
+
+
+# Extra checks a built-in match must pass to count, keyed by pattern object
+# (the original and its twin).  re.compile caches, so a caller's pattern
+# with the same source and flags is the same object: these tables, like
+# _UNBOUNDED_TWINS and _MATCH_COUNTERS, are only consulted for built-ins.
+_MATCH_VALIDATORS: dict[re.Pattern[str], Callable[[str], bool]] = {
+    pattern: _luhn_ok
+    for pattern in (*_DETECTION_PATTERNS["pci_card_data"], *_LOWERCASE_PATTERNS["pci_card_data"])
+    if pattern.pattern == _CARD_NUMBER_PATTERN.pattern
+}
+
+# Twins of the types the prefilter leaves out, for text it finds clean.
+_UNGATED_PATTERNS: dict[str, list[re.Pattern[str]]] = {
+    data_type: patterns
+    for data_type, patterns in _LOWERCASE_PATTERNS.items()
+    if data_type in _UNGATED_TYPES
+}
+
+# Flat view of the lowercase twins; Hyperscan reports hits by index into it.
+# Indices follow data-type order, so hits sorted by index stay grouped and
+# sorted the same way as the per-pattern pass.
+_LOWERCASE_FLAT: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (data_type, pattern)
+    for data_type, patterns in _LOWERCASE_PATTERNS.items()
+    for pattern in patterns
+)
+
+# Length of the shortest string any built-in pattern can match ("w2").
+# Shorter text skips the built-in patterns altogether.
+_MIN_BUILTIN_MATCH_LEN: int = 2
+
+
+def _is_word_char(char: str) -> bool:
+    """Return whether *char* is a ``\\w`` character for a str pattern."""
+    return char.isalnum() or char == "_"
+
+
+def _at_word_boundary(text: str, index: int) -> bool:
+    """Return whether ``\\b`` holds at *index* of *text*."""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+_EMAIL_LOCAL_CHARS: frozenset[str] = frozenset(string.ascii_letters + string.digits + "._%+-")
+
+
+def _count_emails(pattern: re.Pattern[str], text: str, pos: int) -> int:
+    """Return ``len(pattern.findall(text, pos))`` for the email pattern in linear time.
+
+    sre retries the email pattern at every word boundary inside a run of
+    local-part characters, rescanning the run each time, which is quadratic
+    on text such as ``"a.a.a...."``.  A match's local part ends at the first
+    ``@`` after its start, and if a start in that run matches, so does the
+    first word boundary of the run.  One anchored attempt per ``@`` is enough.
+    """
+    count = 0
+    while (at := text.find("@", pos)) != -1:
+        run_start = at
+        while run_start > pos and text[run_start - 1] in _EMAIL_LOCAL_CHARS:
+            run_start -= 1
+        match = None
+        for start in range(run_start, at):
+            if _at_word_boundary(text, start):
+                match = pattern.match(text, start)
+                break
+        if match is None:
+            pos = at + 1
+        else:
+            count += 1
+            pos = match.end()
+    return count
+
+
+# Linear-time replacements for findall on built-ins that sre handles
+# superlinearly.  Keyed by pattern object and built-in only, like
+# _MATCH_VALIDATORS.
+_MATCH_COUNTERS: dict[re.Pattern[str], Callable[[re.Pattern[str], str, int], int]] = {
+    pattern: _count_emails
+    for pattern in (*_DETECTION_PATTERNS["customer_email"], *_LOWERCASE_PATTERNS["customer_email"])
+    if pattern.pattern == _EMAIL_PATTERN.pattern
+}
+
+
+def _count_matches(pattern: re.Pattern[str], text: str, pos: int) -> int:
+    """Count ``pattern.findall(text, pos)`` matches that pass the pattern's validator.
+
+    Uses the unbounded twin when one exists.
+    """
+    counter = _MATCH_COUNTERS.get(pattern)
+    if counter is not None:
+        return counter(pattern, text, pos)
+    validator = _MATCH_VALIDATORS.get(pattern)
+    unbounded = _UNBOUNDED_TWINS.get(pattern)
+    if unbounded is None:
+        found = pattern.findall(text, pos)
+        return len(found) if validator is None else sum(map(validator, found))
+    # Walk the unbounded candidates left to right as findall would, keeping
+    # those that start on a word boundary and resuming after each kept match.
+    count = 0
+    while (candidate := unbounded.search(text, pos)) is not None:
+        start, end = candidate.span()
+        if _at_word_boundary(text, start):
+            if validator is None or validator(candidate.group()):
+                count += 1
+            pos = max(end, start + 1)
+        else:
+            pos = start + 1
+    return count
+
+
+def _pattern_evidence(
+    patterns: Sequence[re.Pattern[str]], text: str, pos: int = 0, *, builtin: bool = True
+) -> list[str]:
+    """Return one redacted evidence line per pattern that matches *text*.
+
+    Built-in patterns are counted by :func:`_count_matches`; caller-supplied
+    ones (``builtin=False``) by a plain :meth:`re.Pattern.findall`.
+    """
+    evidence: list[str] = []
+    for pattern in patterns:
+        count = (
+            _count_matches(pattern, text, pos) if builtin else len(pattern.findall(text, pos))
+        )
+        if count:
+            # Redact actual matched values to avoid echoing PII in results
+            evidence.append(f"[{pattern.pattern[:40]}...] matched {count} time(s)")
+    return evidence
+
+
+def _collect_evidence(
+    patterns_by_type: dict[str, list[re.Pattern[str]]], text: str, pos: int
+) -> list[tuple[str, list[str]]]:
+    """Run each type's patterns from *pos* and keep the types that matched.
+
+    Types outside the prefilter (_UNGATED_TYPES) always run from offset 0.
+    """
+    collected: list[tuple[str, list[str]]] = []
+    for data_type, patterns in patterns_by_type.items():
+        matches = _pattern_evidence(patterns, text, 0 if data_type in _UNGATED_TYPES else pos)
+        if matches:
+            collected.append((data_type, matches))
+    return collected
+
+
+@functools.cache
+def _hyperscan_database() -> Any:
+    """Compile the lowercase twins into a block-mode Hyperscan database once."""
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=[pattern.pattern.encode("ascii") for _, pattern in _LOWERCASE_FLAT],
+        ids=list(range(len(_LOWERCASE_FLAT))),
+        elements=len(_LOWERCASE_FLAT),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(_LOWERCASE_FLAT),
+    )
+    return database
+
+
+def _hyperscan_evidence(haystack: str) -> Iterable[tuple[str, list[str]]]:
+    """Return built-in evidence for lowercased ASCII text via one Hyperscan pass.
+
+    Hyperscan reports every pattern with at least one match anywhere in the
+    text, so only those patterns are counted with :meth:`re.Pattern.findall`.
+    """
+    hit_ids: set[int] = set()
+
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+        hit_ids.add(pattern_id)
+
+    _hyperscan_database().scan(
+        haystack.encode("ascii"), match_event_handler=on_match
+    )
+    evidence: dict[str, list[str]] = {}
+    for pattern_id in sorted(hit_ids):
+        data_type, pattern = _LOWERCASE_FLAT[pattern_id]
+        matches = _pattern_evidence([pattern], haystack)
+        if matches:
+            evidence.setdefault(data_type, []).extend(matches)
+    return evidence.items()
+
+
+def _builtin_evidence(text: str) -> Iterable[tuple[str, list[str]]]:
+    """Return ``(data_type, evidence)`` pairs for built-in patterns, in type order."""
+    if len(text) < _MIN_BUILTIN_MATCH_LEN:
+        return ()
+    # Non-ASCII text keeps the original IGNORECASE patterns and runs them all.
+    if not text.isascii():
+        return _collect_evidence(_ORDERED_PATTERNS, text, 0)
+    # ASCII text is lowercased once and matched case-sensitively.
+    haystack = text.lower().translate(_SEPARATORS_TO_SPACE)
+    if _HAS_HYPERSCAN:
+        return _hyperscan_evidence(haystack)
+    first_hit = _BUILTIN_PREFILTER.search(haystack)
+    if first_hit is None:
+        return _collect_evidence(_UNGATED_PATTERNS, haystack, 0)
+    return _collect_evidence(_LOWERCASE_PATTERNS, haystack, first_hit.start())
+
+
+@dataclass(slots=True)
 class DetectionResult:
-    """Result of a data sensitivity scan."""
+    """Result of a data sensitivity scan.
+
+    Slotted: a result is built for every scanned string, so batch
+    classification creates many of them.
+    """
 
     detected_types: list[str] = field(default_factory=list)
     """Data types found in the scanned text."""
@@ -124,6 +465,12 @@ class DataSensitivityDetector:
         accompanied by a score entry.
     custom_scores:
         Optional score overrides or additions for custom data types.
+
+    Raises
+    ------
+    TypeError
+        If a custom pattern is not a compiled :class:`re.Pattern`.  Patterns
+        are stored as given and never recompiled from their source.
     """
 
     def __init__(
@@ -131,15 +478,19 @@ class DataSensitivityDetector:
         custom_patterns: dict[str, list[re.Pattern[str]]] | None = None,
         custom_scores: dict[str, int] | None = None,
     ) -> None:
-        self._patterns: dict[str, list[re.Pattern[str]]] = dict(_DETECTION_PATTERNS)
-        if custom_patterns:
-            for data_type, patterns in custom_patterns.items():
-                existing = self._patterns.get(data_type, [])
-                self._patterns[data_type] = existing + patterns
-
-        self._scores: dict[str, int] = dict(DATA_SENSITIVITY)
-        if custom_scores:
-            self._scores.update(custom_scores)
+        # Built-in patterns are shared module state and go through the
+        # prefilter; caller-supplied patterns are kept apart and always run.
+        self._custom_patterns: dict[str, tuple[re.Pattern[str], ...]] = {
+            data_type: tuple(patterns) for data_type, patterns in (custom_patterns or {}).items()
+        }
+        for data_type, patterns in self._custom_patterns.items():
+            for pattern in patterns:
+                if not isinstance(pattern, re.Pattern):
+                    raise TypeError(
+                        f"Custom patterns for {data_type!r} must be compiled re.Pattern "
+                        f"objects, got {type(pattern).__name__}."
+                    )
+        self._scores: dict[str, int] = {**DATA_SENSITIVITY, **(custom_scores or {})}
 
     def scan(self, text: str) -> DetectionResult:
         """Scan text for sensitive data patterns.
@@ -156,34 +507,53 @@ class DataSensitivityDetector:
             Aggregated detection findings including detected types,
             max sensitivity score, and recommended sovereignty level.
         """
-        detected_types: list[str] = []
+        if len(text) < _MIN_BUILTIN_MATCH_LEN and not self._custom_patterns:
+            return DetectionResult()
+
         evidence: dict[str, list[str]] = {}
-        max_score = 1
 
-        for data_type, patterns in self._patterns.items():
-            matches: list[str] = []
-            for pattern in patterns:
-                found = pattern.findall(text)
-                if found:
-                    # Redact actual matched values to avoid echoing PII in results
-                    matches.append(f"[{pattern.pattern[:40]}...] matched {len(found)} time(s)")
+        # The maximum score is tracked as types fire.  There is no early exit
+        # at the top score: every type still has to be reported.
+        scores = self._scores
+        max_score = 1
+        for data_type, matches in _builtin_evidence(text):
+            evidence[data_type] = matches
+            max_score = max(max_score, scores.get(data_type, 1))
 
+        for data_type, patterns in self._custom_patterns.items():
+            matches = _pattern_evidence(patterns, text, builtin=False)
             if matches:
-                detected_types.append(data_type)
-                evidence[data_type] = matches
-                score = self._scores.get(data_type, 1)
-                if score > max_score:
-                    max_score = score
+                evidence.setdefault(data_type, []).extend(matches)
+                max_score = max(max_score, scores.get(data_type, 1))
 
         sovereignty_level = _score_to_level(max_score)
 
         return DetectionResult(
-            detected_types=sorted(detected_types),
+            detected_types=sorted(evidence) if self._custom_patterns else list(evidence),
             max_level=max_score,
             sovereignty_level=sovereignty_level,
             evidence=evidence,
         )
 
+    def scan_bytes(self, data: bytes) -> DetectionResult:
+        """Scan UTF-8 encoded bytes, such as raw log lines or telemetry.
+
+        Invalid UTF-8 sequences are replaced with U+FFFD rather than
+        raising.  ASCII input decodes to an ASCII string and takes the same
+        lowercased ``re.ASCII`` path as :meth:`scan`.
+
+        Parameters
+        ----------
+        data:
+            UTF-8 encoded content to scan.
+
+        Returns
+        -------
+        DetectionResult
+            Same as :meth:`scan` on the decoded text.
+        """
+        return self.scan(data.decode("utf-8", errors="replace"))
+
     def score_data_types(self, data_types: list[str]) -> int:
         """Return the maximum sensitivity score for a list of data type keys.
 
@@ -214,8 +584,13 @@ def _score_to_level(score: int) -> SovereigntyLevel:
     SovereigntyLevel
         The sovereignty level matching the score, clamped to the valid range.
     """
-    clamped = max(1, min(7, score))
-    return SovereigntyLevel(clamped)
+    return _SCORE_TO_LEVEL[max(1, min(7, score))]
+
+
+# Level for each clamped score, indexed by score; index 0 is never used.
+_SCORE_TO_LEVEL: tuple[SovereigntyLevel, ...] = tuple(
+    SovereigntyLevel(max(score, 1)) for score in range(8)
+)
 
 
 __all__ = [
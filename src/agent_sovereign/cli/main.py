@@ -23,12 +23,18 @@ from __future__ import annotations
 import json
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
 
 import click
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 
+if TYPE_CHECKING:
+    from agent_sovereign.bundler.hashing import HashAlgorithm
+    from agent_sovereign.classifier.assessor import SovereigntyAssessment
+
 console = Console()
 
 
@@ -68,6 +74,22 @@ def plugins_command() -> None:
 # ---------------------------------------------------------------------------
 
 
+def _assessment_summary(assessment: SovereigntyAssessment) -> dict[str, Any]:
+    """Return the summary ``assess --json-output`` prints, with levels reduced to names."""
+    return {
+        "level": assessment.level.name,
+        "score": assessment.score,
+        "justification": assessment.justification,
+        "data_sensitivity": assessment.data_sensitivity,
+        "regulatory_drivers": {
+            reg: level.name for reg, level in assessment.regulatory_drivers.items()
+        },
+        "deployment_template": assessment.deployment_template,
+        "warnings": assessment.warnings,
+        "capability_requirements": assessment.capability_requirements,
+    }
+
+
 @cli.command(name="assess")
 @click.option(
     "--data-types",
@@ -130,19 +152,7 @@ def assess_command(
     )
 
     if json_output:
-        output = {
-            "level": assessment.level.name,
-            "score": assessment.score,
-            "justification": assessment.justification,
-            "data_sensitivity": assessment.data_sensitivity,
-            "regulatory_drivers": {
-                reg: level.name for reg, level in assessment.regulatory_drivers.items()
-            },
-            "deployment_template": assessment.deployment_template,
-            "warnings": assessment.warnings,
-            "capability_requirements": assessment.capability_requirements,
-        }
-        console.print_json(json.dumps(output, indent=2))
+        console.print_json(json.dumps(_assessment_summary(assessment), indent=2))
         return
 
     console.print(
@@ -1040,6 +1050,13 @@ def bundle_group() -> None:
     default=False,
     help="Include test files in the bundle.",
 )
+@click.option(
+    "--hash-algorithm",
+    type=click.Choice(["sha256", "blake3"], case_sensitive=False),
+    default="sha256",
+    show_default=True,
+    help="Checksum algorithm for bundle components (blake3 requires the blake3 extra).",
+)
 @click.option(
     "--json-output",
     is_flag=True,
@@ -1054,6 +1071,7 @@ def bundle_package_command(
     compress: bool,
     include_model: bool,
     include_tests: bool,
+    hash_algorithm: str,
     json_output: bool,
 ) -> None:
     """Scan a source directory and produce a BundleManifest.
@@ -1075,6 +1093,8 @@ def bundle_package_command(
         include_model=include_model,
         include_tests=include_tests,
         compress=compress,
+        # click.Choice(case_sensitive=False) already returns the canonical choice
+        hash_algorithm=cast("HashAlgorithm", hash_algorithm),
     )
     packager = AgentPackager(config)
 
@@ -1085,8 +1105,9 @@ def bundle_package_command(
             sovereignty_level=sovereignty_level,
             target_platform=target_platform,
         )
-    except (FileNotFoundError, ValueError) as exc:
-        console.print(f"[red]Packaging error:[/red] {exc}")
+    except (FileNotFoundError, ValueError, ImportError) as exc:
+        # escape(): the install hint's "[blake3]" would otherwise be read as markup
+        console.print(f"[red]Packaging error:[/red] {escape(str(exc))}")
         sys.exit(1)
 
     errors = packager.validate_bundle(manifest, output)
@@ -1285,7 +1306,11 @@ def bundle_verify_command(
         console.print(f"[red]Failed to load manifest:[/red] {exc}")
         sys.exit(1)
 
-    results = bundle_manifest.verify_checksums(bundle_dir)
+    try:
+        results = bundle_manifest.verify_checksums(bundle_dir)
+    except ImportError as exc:
+        console.print(f"[red]Verification error:[/red] {escape(str(exc))}")
+        sys.exit(1)
     all_valid = all(valid for _, valid in results)
 
     if json_output:
@@ -1352,9 +1377,12 @@ def bundle_attest_command(
     output: Path,
     issuer: str,
     json_output: bool,
-) -> None:
+) -> dict[str, object] | None:
     """Generate build provenance and integrity attestations for a bundle.
 
+    With --json-output the printed summary is also returned, so callers
+    invoking the command with standalone_mode=False can use it directly.
+
     Examples:
 
     \b
@@ -1375,7 +1403,11 @@ def bundle_attest_command(
 
     bundle_dir = manifest.parent
     provenance_att = generator.generate_build_provenance(bundle_manifest)
-    integrity_att = generator.generate_integrity_attestation(bundle_manifest, bundle_dir)
+    try:
+        integrity_att = generator.generate_integrity_attestation(bundle_manifest, bundle_dir)
+    except ImportError as exc:
+        console.print(f"[red]Attestation error:[/red] {escape(str(exc))}")
+        sys.exit(1)
 
     attestations = [provenance_att, integrity_att]
 
@@ -1398,7 +1430,7 @@ def bundle_attest_command(
             "output_path": str(output),
         }
         console.print_json(json.dumps(summary, indent=2))
-        return
+        return summary
 
     console.print(
         Panel(
@@ -1413,6 +1445,7 @@ def bundle_attest_command(
             f"id={att.attestation_id}  issued={att.issued_at.isoformat()}"
         )
     console.print(f"\n  Written to: {output}")
+    return None
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ its stated sovereignty obligations.
 from __future__ import annotations
 
 import datetime
+import functools
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -324,8 +325,9 @@ class SovereigntyComplianceChecker:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def _severity_for_check(check_id: str, level: SovereigntyLevel) -> str:
-        """Map a validation check ID to a severity level.
+        """Map a validation check ID to a severity level, memoised on both inputs.
 
         Parameters
         ----------
@@ -352,8 +354,13 @@ class SovereigntyComplianceChecker:
         return "medium"
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def _remediation_for_check(check_id: str) -> str:
-        """Return a remediation suggestion for a failed check.
+        """Return a remediation suggestion for a failed check, memoised per ID.
+
+        Every failed check in every report asks for its remediation, so the
+        result is cached rather than rebuilding the remediation table on
+        each call.
 
         Parameters
         ----------
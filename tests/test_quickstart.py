@@ -55,3 +55,26 @@ def test_quickstart_assessor_accessible() -> None:
 
     bundler = Bundler()
     assert isinstance(bundler.assessor, SovereigntyAssessor)
+
+
+def test_every_public_name_resolves() -> None:
+    import agent_sovereign
+
+    for name in agent_sovereign.__all__:
+        assert getattr(agent_sovereign, name) is not None
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    import pytest
+
+    import agent_sovereign
+
+    with pytest.raises(AttributeError, match="no_such_name"):
+        agent_sovereign.no_such_name  # noqa: B018
+
+
+def test_subpackages_reachable_as_attributes() -> None:
+    import agent_sovereign
+
+    for subpackage in ("classifier", "compliance", "deployment", "edge", "residency"):
+        assert getattr(agent_sovereign, subpackage).__name__ == f"agent_sovereign.{subpackage}"
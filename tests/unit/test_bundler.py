@@ -15,20 +15,26 @@ Covers:
 from __future__ import annotations
 
 import datetime
+import enum
 import hashlib
 import json
+import sys
 from pathlib import Path
 from typing import Any
 
 import pytest
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
 
+from agent_sovereign.bundler import attestation as attestation_module
+from agent_sovereign.bundler import hashing as hashing_module
+from agent_sovereign.bundler import manifest as manifest_module
 from agent_sovereign.bundler.attestation import (
     Attestation,
     AttestationGenerator,
     AttestationType,
 )
 from agent_sovereign.bundler.docker_generator import DockerConfig, DockerGenerator
+from agent_sovereign.bundler.hashing import HashAlgorithm, file_checksum
 from agent_sovereign.bundler.manifest import (
     BundleComponent,
     BundleManifest,
@@ -37,11 +43,26 @@ from agent_sovereign.bundler.manifest import (
 from agent_sovereign.bundler.packager import AgentPackager, PackageConfig
 from agent_sovereign.cli.main import cli
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the optional extra
+    orjson = None  # type: ignore[assignment]
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Well-formed but deliberately wrong SHA-256 hex digests.
+_BAD_SHA_A = "a" * 64
+_BAD_SHA_B = "b" * 64
+
+
+class _BuildStage(enum.Enum):
+    """Plain (non-str) enum for attestation metadata round-trip tests."""
+
+    RELEASE = 1
+
 
 def _sha256(content: bytes) -> str:
     return hashlib.sha256(content).hexdigest()
@@ -89,6 +110,14 @@ def _write_files(
         file_path.write_bytes(content)
 
 
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file from its raw bytes, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("rb") as fh:
+        return json.load(fh)
+
+
 # ---------------------------------------------------------------------------
 # BundleComponent tests
 # ---------------------------------------------------------------------------
@@ -158,6 +187,14 @@ class TestBundleComponent:
         comp = _make_component(checksum=checksum)
         assert comp.checksum == checksum
 
+    def test_uses_slots_without_instance_dict(self) -> None:
+        assert not hasattr(_make_component(), "__dict__")
+
+    def test_valid_types_not_serialised_per_component(self) -> None:
+        manifest = _make_manifest(components=[_make_component()])
+        raw = json.loads(manifest.to_json())
+        assert "_VALID_TYPES" not in raw["components"][0]
+
 
 # ---------------------------------------------------------------------------
 # BundleSovereigntyLevel tests
@@ -261,6 +298,17 @@ class TestBundleManifest:
         with pytest.raises(ValueError, match="already exists"):
             manifest.add_component(comp)
 
+    def test_add_components_batch(self) -> None:
+        manifest = _make_manifest(components=[_make_component(name="a")])
+        manifest.add_components([_make_component(name="b"), _make_component(name="c")])
+        assert [c.name for c in manifest.components] == ["a", "b", "c"]
+
+    def test_add_components_duplicate_within_batch_raises(self) -> None:
+        manifest = _make_manifest()
+        with pytest.raises(ValueError, match="already exists"):
+            manifest.add_components([_make_component(name="x"), _make_component(name="x")])
+        assert [c.name for c in manifest.components] == ["x"]
+
     def test_remove_component(self) -> None:
         comp = _make_component(name="removable")
         manifest = _make_manifest(components=[comp])
@@ -334,6 +382,14 @@ class TestBundleManifest:
         assert restored.metadata["env"] == "production"
         assert restored.metadata["version"] == "1.2.3"
 
+    def test_from_json_malformed_raises(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            BundleManifest.from_json("{invalid")
+
+
+@pytest.mark.filesystem
+@pytest.mark.xdist_group("filesystem")
+class TestBundleManifestVerifyChecksums:
     def test_verify_checksums_all_valid(self, tmp_path: Path) -> None:
         content = b"model weights"
         checksum = _sha256(content)
@@ -363,7 +419,7 @@ class TestBundleManifest:
             component_type="model",
             path="model.bin",
             size_bytes=len(content),
-            checksum="a" * 64,  # wrong checksum
+            checksum=_BAD_SHA_A,  # wrong checksum
         )
         manifest = _make_manifest(components=[comp])
         results = manifest.verify_checksums(tmp_path)
@@ -376,7 +432,7 @@ class TestBundleManifest:
             component_type="data",
             path="ghost.bin",
             size_bytes=0,
-            checksum="a" * 64,
+            checksum=_BAD_SHA_A,
         )
         manifest = _make_manifest(components=[comp])
         results = manifest.verify_checksums(tmp_path)
@@ -394,7 +450,7 @@ class TestBundleManifest:
         (tmp_path / "good.bin").write_bytes(good_content)
 
         bad_content = b"bad"
-        bad_checksum = "b" * 64  # wrong
+        bad_checksum = _BAD_SHA_B  # wrong
         (tmp_path / "bad.bin").write_bytes(bad_content)
 
         comp_good = BundleComponent("good", "data", "good.bin", 4, good_checksum)
@@ -405,49 +461,78 @@ class TestBundleManifest:
         assert results["good"] is True
         assert results["bad"] is False
 
+    def test_verify_checksums_size_mismatch_skips_hashing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        content = b"truncated"
+        (tmp_path / "model.bin").write_bytes(content)
+        comp = BundleComponent("model", "model", "model.bin", len(content) + 1, _sha256(content))
+        manifest = _make_manifest(components=[comp])
 
-# ---------------------------------------------------------------------------
-# DockerConfig tests
-# ---------------------------------------------------------------------------
-
-
-class TestDockerConfig:
-    def test_default_base_image(self) -> None:
-        config = DockerConfig()
-        assert config.base_image == "python:3.11-slim"
+        def _fail(*_: object) -> str:
+            raise AssertionError("file should not be hashed")
 
-    def test_default_python_version(self) -> None:
-        config = DockerConfig()
-        assert config.python_version == "3.11"
+        monkeypatch.setattr(manifest_module, "file_checksum", _fail)
+        assert manifest.verify_checksums(tmp_path) == [("model", False)]
 
-    def test_default_expose_ports(self) -> None:
-        config = DockerConfig()
-        assert config.expose_ports == [8080]
+    def test_verify_checksums_many_components_preserves_order(self, tmp_path: Path) -> None:
+        components = []
+        for index in range(12):
+            content = f"payload-{index}".encode()
+            (tmp_path / f"part{index}.bin").write_bytes(content)
+            checksum = _sha256(content) if index % 3 else _BAD_SHA_A
+            components.append(
+                BundleComponent(f"part{index}", "data", f"part{index}.bin", len(content), checksum)
+            )
+        manifest = _make_manifest(components=components)
 
-    def test_custom_base_image(self) -> None:
-        config = DockerConfig(base_image="debian:bookworm-slim")
-        assert config.base_image == "debian:bookworm-slim"
+        results = manifest.verify_checksums(tmp_path)
 
-    def test_custom_ports(self) -> None:
-        config = DockerConfig(expose_ports=[8080, 9090])
-        assert 9090 in config.expose_ports
+        assert [name for name, _ in results] == [f"part{i}" for i in range(12)]
+        assert [valid for _, valid in results] == [bool(i % 3) for i in range(12)]
 
-    def test_env_vars_stored(self) -> None:
-        config = DockerConfig(env_vars={"PYTHONPATH": "/app"})
-        assert config.env_vars["PYTHONPATH"] == "/app"
 
-    def test_healthcheck_cmd_stored(self) -> None:
-        cmd = "curl -f http://localhost:8080/health"
-        config = DockerConfig(healthcheck_cmd=cmd)
-        assert config.healthcheck_cmd == cmd
+# ---------------------------------------------------------------------------
+# DockerConfig tests
+# ---------------------------------------------------------------------------
 
-    def test_healthcheck_cmd_default_none(self) -> None:
-        config = DockerConfig()
-        assert config.healthcheck_cmd is None
 
-    def test_labels_stored(self) -> None:
-        config = DockerConfig(labels={"org.opencontainers.image.title": "test"})
-        assert config.labels["org.opencontainers.image.title"] == "test"
+class TestDockerConfig:
+    @pytest.mark.parametrize(
+        ("kwargs", "attr", "expected"),
+        [
+            ({}, "base_image", "python:3.11-slim"),
+            ({}, "python_version", "3.11"),
+            ({}, "expose_ports", [8080]),
+            ({}, "healthcheck_cmd", None),
+            ({"base_image": "debian:bookworm-slim"}, "base_image", "debian:bookworm-slim"),
+            ({"expose_ports": [8080, 9090]}, "expose_ports", [8080, 9090]),
+            ({"env_vars": {"PYTHONPATH": "/app"}}, "env_vars", {"PYTHONPATH": "/app"}),
+            (
+                {"healthcheck_cmd": "curl -f http://localhost:8080/health"},
+                "healthcheck_cmd",
+                "curl -f http://localhost:8080/health",
+            ),
+            (
+                {"labels": {"org.opencontainers.image.title": "test"}},
+                "labels",
+                {"org.opencontainers.image.title": "test"},
+            ),
+        ],
+        ids=[
+            "default_base_image",
+            "default_python_version",
+            "default_expose_ports",
+            "default_healthcheck_none",
+            "custom_base_image",
+            "custom_ports",
+            "env_vars",
+            "healthcheck_cmd",
+            "labels",
+        ],
+    )
+    def test_field_value(self, kwargs: dict[str, Any], attr: str, expected: object) -> None:
+        assert getattr(DockerConfig(**kwargs), attr) == expected
 
     def test_frozen_immutability(self) -> None:
         config = DockerConfig()
@@ -460,6 +545,30 @@ class TestDockerConfig:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="class")
+def rendered_dockerfile() -> str:
+    comp = _make_component(
+        name="agent-code",
+        component_type="agent_code",
+        path="src/agent.py",
+    )
+    config = DockerConfig(
+        healthcheck_cmd="curl -f http://localhost:8080/health",
+        env_vars={"LOG_LEVEL": "info"},
+    )
+    return DockerGenerator().generate_dockerfile(_make_manifest(components=[comp]), config)
+
+
+@pytest.fixture(scope="class")
+def dockerfile_tokens(rendered_dockerfile: str) -> frozenset[str]:
+    return frozenset(rendered_dockerfile.split())
+
+
+@pytest.fixture(scope="class")
+def dockerignore_output() -> str:
+    return DockerGenerator().generate_dockerignore()
+
+
 class TestDockerGenerator:
     @pytest.fixture()
     def generator(self) -> DockerGenerator:
@@ -481,49 +590,32 @@ class TestDockerGenerator:
             env_vars={"LOG_LEVEL": "info"},
         )
 
-    def test_generate_dockerfile_returns_string(
-        self, generator: DockerGenerator, manifest: BundleManifest, config: DockerConfig
-    ) -> None:
-        result = generator.generate_dockerfile(manifest, config)
-        assert isinstance(result, str)
-
-    def test_dockerfile_starts_with_syntax_comment(
-        self, generator: DockerGenerator, manifest: BundleManifest, config: DockerConfig
-    ) -> None:
-        result = generator.generate_dockerfile(manifest, config)
-        assert "# syntax=docker/dockerfile:1" in result
-
-    def test_dockerfile_has_builder_stage(
-        self, generator: DockerGenerator, manifest: BundleManifest, config: DockerConfig
-    ) -> None:
-        result = generator.generate_dockerfile(manifest, config)
-        assert "AS builder" in result
-
-    def test_dockerfile_has_runtime_stage(
-        self, generator: DockerGenerator, manifest: BundleManifest, config: DockerConfig
-    ) -> None:
-        result = generator.generate_dockerfile(manifest, config)
-        assert "AS runtime" in result
-
-    def test_dockerfile_uses_non_root_user(
-        self, generator: DockerGenerator, manifest: BundleManifest, config: DockerConfig
-    ) -> None:
-        result = generator.generate_dockerfile(manifest, config)
-        assert "agentuser" in result
-        assert "USER agentuser" in result
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            "# syntax=docker/dockerfile:1",
+            "AS builder",
+            "AS runtime",
+            "USER agentuser",
+            "EXPOSE 8080",
+            "curl -f",
+            "LOG_LEVEL",
+            "requirements.txt",
+            "com.aumos.sovereignty",
+        ],
+    )
+    def test_dockerfile_contains(self, rendered_dockerfile: str, needle: str) -> None:
+        assert needle in rendered_dockerfile
 
-    def test_dockerfile_exposes_port(
-        self, generator: DockerGenerator, manifest: BundleManifest, config: DockerConfig
-    ) -> None:
-        result = generator.generate_dockerfile(manifest, config)
-        assert "EXPOSE 8080" in result
+    def test_dockerfile_has_instruction_tokens(self, dockerfile_tokens: frozenset[str]) -> None:
+        expected = frozenset({"HEALTHCHECK", "ENTRYPOINT", "EXPOSE", "USER", "agentuser"})
+        assert expected <= dockerfile_tokens
 
-    def test_dockerfile_has_healthcheck_when_configured(
+    def test_generate_dockerfile_returns_string(
         self, generator: DockerGenerator, manifest: BundleManifest, config: DockerConfig
     ) -> None:
         result = generator.generate_dockerfile(manifest, config)
-        assert "HEALTHCHECK" in result
-        assert "curl -f" in result
+        assert isinstance(result, str)
 
     def test_dockerfile_no_healthcheck_when_none(
         self, generator: DockerGenerator, manifest: BundleManifest
@@ -532,12 +624,6 @@ class TestDockerGenerator:
         result = generator.generate_dockerfile(manifest, config)
         assert "HEALTHCHECK" not in result
 
-    def test_dockerfile_includes_env_vars(
-        self, generator: DockerGenerator, manifest: BundleManifest, config: DockerConfig
-    ) -> None:
-        result = generator.generate_dockerfile(manifest, config)
-        assert "LOG_LEVEL" in result
-
     def test_dockerfile_includes_bundle_id_comment(
         self, generator: DockerGenerator, manifest: BundleManifest, config: DockerConfig
     ) -> None:
@@ -553,24 +639,6 @@ class TestDockerGenerator:
         result = generator.generate_dockerfile(full_manifest, config)
         assert "AGENT_SOVEREIGN_MODE=full" in result
 
-    def test_dockerfile_copies_requirements(
-        self, generator: DockerGenerator, manifest: BundleManifest, config: DockerConfig
-    ) -> None:
-        result = generator.generate_dockerfile(manifest, config)
-        assert "requirements.txt" in result
-
-    def test_dockerfile_includes_label_with_sovereignty(
-        self, generator: DockerGenerator, manifest: BundleManifest, config: DockerConfig
-    ) -> None:
-        result = generator.generate_dockerfile(manifest, config)
-        assert "com.aumos.sovereignty" in result
-
-    def test_dockerfile_has_entrypoint(
-        self, generator: DockerGenerator, manifest: BundleManifest, config: DockerConfig
-    ) -> None:
-        result = generator.generate_dockerfile(manifest, config)
-        assert "ENTRYPOINT" in result
-
     def test_generate_compose_returns_string(
         self, generator: DockerGenerator, manifest: BundleManifest, config: DockerConfig
     ) -> None:
@@ -639,47 +707,15 @@ class TestDockerGenerator:
         assert "volumes:" in result
         assert "models" in result
 
-    def test_generate_dockerignore_returns_string(
-        self, generator: DockerGenerator
-    ) -> None:
-        result = generator.generate_dockerignore()
-        assert isinstance(result, str)
-
-    def test_dockerignore_excludes_git(
-        self, generator: DockerGenerator
-    ) -> None:
-        result = generator.generate_dockerignore()
-        assert ".git" in result
-
-    def test_dockerignore_excludes_pycache(
-        self, generator: DockerGenerator
-    ) -> None:
-        result = generator.generate_dockerignore()
-        assert "__pycache__" in result
-
-    def test_dockerignore_excludes_venv(
-        self, generator: DockerGenerator
-    ) -> None:
-        result = generator.generate_dockerignore()
-        assert ".venv" in result
+    def test_generate_dockerignore_returns_string(self, dockerignore_output: str) -> None:
+        assert isinstance(dockerignore_output, str)
 
-    def test_dockerignore_excludes_tests(
-        self, generator: DockerGenerator
-    ) -> None:
-        result = generator.generate_dockerignore()
-        assert "tests/" in result
-
-    def test_dockerignore_excludes_env_files(
-        self, generator: DockerGenerator
-    ) -> None:
-        result = generator.generate_dockerignore()
-        assert ".env" in result
-
-    def test_dockerignore_excludes_dotfiles(
-        self, generator: DockerGenerator
-    ) -> None:
-        result = generator.generate_dockerignore()
-        assert ".DS_Store" in result
+    @pytest.mark.parametrize(
+        "pattern",
+        [".git", "__pycache__", ".venv", "tests/", ".env", ".DS_Store"],
+    )
+    def test_dockerignore_excludes(self, dockerignore_output: str, pattern: str) -> None:
+        assert pattern in dockerignore_output
 
     def test_generate_dockerfile_custom_base_image(
         self, generator: DockerGenerator, manifest: BundleManifest
@@ -698,11 +734,76 @@ class TestDockerGenerator:
         assert "EXPOSE 3000" in result
 
 
+# ---------------------------------------------------------------------------
+# Hashing tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.filesystem
+@pytest.mark.xdist_group("filesystem")
+class TestFileChecksum:
+    def test_sha256_matches_hashlib(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "weights.bin"
+        file_path.write_bytes(b"x" * 3_000_000)
+        assert file_checksum(file_path) == _sha256(b"x" * 3_000_000)
+
+    def test_sha256_memory_mapped_path_matches_hashlib(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(hashing_module, "_MMAP_THRESHOLD", 1024)
+        file_path = tmp_path / "weights.bin"
+        file_path.write_bytes(b"y" * 4096)
+        assert file_checksum(file_path) == _sha256(b"y" * 4096)
+
+    def test_unsupported_algorithm_raises(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "f.bin"
+        file_path.write_bytes(b"data")
+        with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+            file_checksum(file_path, "md5")  # type: ignore[arg-type]
+
+    def test_blake3_missing_dependency_raises_import_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setitem(sys.modules, "blake3", None)
+        file_path = tmp_path / "f.bin"
+        file_path.write_bytes(b"data")
+        with pytest.raises(ImportError, match="blake3"):
+            file_checksum(file_path, "blake3")
+
+    def test_blake3_digest_is_64_hex_chars(self, tmp_path: Path) -> None:
+        blake3 = pytest.importorskip("blake3")
+        file_path = tmp_path / "f.bin"
+        file_path.write_bytes(b"data")
+        checksum = file_checksum(file_path, "blake3")
+        assert checksum == blake3.blake3(b"data").hexdigest()
+        assert len(checksum) == 64
+
+    def test_manifest_round_trips_hash_algorithm(self) -> None:
+        manifest = BundleManifest(
+            sovereignty_level=BundleSovereigntyLevel.FULL,
+            target_platform="edge",
+            hash_algorithm="blake3",
+        )
+        restored = BundleManifest.from_json(manifest.to_json())
+        assert restored.hash_algorithm == "blake3"
+
+    def test_manifest_defaults_to_sha256(self) -> None:
+        assert _make_manifest().hash_algorithm == "sha256"
+
+
 # ---------------------------------------------------------------------------
 # AgentPackager tests
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def packager(tmp_path_factory: pytest.TempPathFactory) -> AgentPackager:
+    # AgentPackager holds only its frozen config, so one instance is shared.
+    return AgentPackager(PackageConfig(output_dir=tmp_path_factory.mktemp("output")))
+
+
+@pytest.mark.filesystem
+@pytest.mark.xdist_group("filesystem")
 class TestAgentPackager:
     @pytest.fixture()
     def output_dir(self, tmp_path: Path) -> Path:
@@ -710,14 +811,6 @@ class TestAgentPackager:
         out.mkdir()
         return out
 
-    @pytest.fixture()
-    def config(self, output_dir: Path) -> PackageConfig:
-        return PackageConfig(output_dir=output_dir)
-
-    @pytest.fixture()
-    def packager(self, config: PackageConfig) -> AgentPackager:
-        return AgentPackager(config)
-
     def test_package_nonexistent_dir_raises(
         self, packager: AgentPackager, tmp_path: Path
     ) -> None:
@@ -906,6 +999,10 @@ class TestAgentPackager:
         ]
         assert packager.estimate_bundle_size(comps) == 300
 
+    def test_estimate_bundle_size_accepts_generator(self, packager: AgentPackager) -> None:
+        comps = (_make_component(name=f"c{i}", size_bytes=i) for i in range(5))
+        assert packager.estimate_bundle_size(comps) == 10
+
     def test_validate_bundle_no_components(
         self, packager: AgentPackager, output_dir: Path
     ) -> None:
@@ -970,6 +1067,28 @@ class TestAgentPackager:
         paths = [c.path for c in components]
         assert not any("__pycache__" in p for p in paths)
 
+    def test_scan_directory_prunes_nested_excluded_subtrees(
+        self, packager: AgentPackager, tmp_path: Path
+    ) -> None:
+        source = tmp_path / "src"
+        (source / "node_modules" / "pkg").mkdir(parents=True)
+        (source / "node_modules" / "pkg" / "index.js").write_text("module.exports = 1")
+        (source / "tests" / "fixtures").mkdir(parents=True)
+        (source / "tests" / "fixtures" / "sample.yaml").write_text("a: 1")
+        (source / "agent.py").write_text("x = 1")
+        components = packager.scan_directory(source)
+        assert [c.path for c in components] == ["agent.py"]
+
+    def test_scan_directory_skips_stray_bytecode(
+        self, packager: AgentPackager, tmp_path: Path
+    ) -> None:
+        source = tmp_path / "src"
+        source.mkdir()
+        (source / "agent.pyc").write_bytes(b"\x00")
+        (source / "agent.pyo").write_bytes(b"\x00")
+        (source / "agent.py").write_text("x = 1")
+        assert [c.path for c in packager.scan_directory(source)] == ["agent.py"]
+
     def test_scan_directory_empty(
         self, packager: AgentPackager, tmp_path: Path
     ) -> None:
@@ -995,11 +1114,12 @@ class TestAgentPackager:
 # ---------------------------------------------------------------------------
 
 
-class TestAttestationGenerator:
-    @pytest.fixture()
-    def generator(self) -> AttestationGenerator:
-        return AttestationGenerator(issuer="test-issuer")
+@pytest.fixture(scope="module")
+def attestation_generator() -> AttestationGenerator:
+    return AttestationGenerator(issuer="test-issuer")
+
 
+class TestAttestationGenerator:
     @pytest.fixture()
     def manifest(self) -> BundleManifest:
         comp = _make_component()
@@ -1009,65 +1129,65 @@ class TestAttestationGenerator:
         )
 
     def test_build_provenance_returns_attestation(
-        self, generator: AttestationGenerator, manifest: BundleManifest
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest
     ) -> None:
-        att = generator.generate_build_provenance(manifest)
+        att = attestation_generator.generate_build_provenance(manifest)
         assert isinstance(att, Attestation)
 
     def test_build_provenance_type(
-        self, generator: AttestationGenerator, manifest: BundleManifest
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest
     ) -> None:
-        att = generator.generate_build_provenance(manifest)
+        att = attestation_generator.generate_build_provenance(manifest)
         assert att.attestation_type == AttestationType.BUILD_PROVENANCE
 
     def test_build_provenance_subject_is_bundle_id(
-        self, generator: AttestationGenerator, manifest: BundleManifest
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest
     ) -> None:
-        att = generator.generate_build_provenance(manifest)
+        att = attestation_generator.generate_build_provenance(manifest)
         assert att.subject == manifest.bundle_id
 
     def test_build_provenance_issuer(
-        self, generator: AttestationGenerator, manifest: BundleManifest
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest
     ) -> None:
-        att = generator.generate_build_provenance(manifest)
+        att = attestation_generator.generate_build_provenance(manifest)
         assert att.issuer == "test-issuer"
 
     def test_build_provenance_has_signature(
-        self, generator: AttestationGenerator, manifest: BundleManifest
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest
     ) -> None:
-        att = generator.generate_build_provenance(manifest)
+        att = attestation_generator.generate_build_provenance(manifest)
         assert att.signature is not None
         assert len(att.signature) == 64
 
     def test_build_provenance_claims_contain_component_hashes(
-        self, generator: AttestationGenerator, manifest: BundleManifest
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest
     ) -> None:
-        att = generator.generate_build_provenance(manifest)
+        att = attestation_generator.generate_build_provenance(manifest)
         assert "component_hashes" in att.claims
         assert "my-model" in att.claims["component_hashes"]
 
     def test_build_provenance_claims_contain_platform(
-        self, generator: AttestationGenerator, manifest: BundleManifest
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest
     ) -> None:
-        att = generator.generate_build_provenance(manifest)
+        att = attestation_generator.generate_build_provenance(manifest)
         assert "platform" in att.claims
         assert "python_version" in att.claims
 
     def test_build_provenance_unique_ids(
-        self, generator: AttestationGenerator, manifest: BundleManifest
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest
     ) -> None:
-        att1 = generator.generate_build_provenance(manifest)
-        att2 = generator.generate_build_provenance(manifest)
+        att1 = attestation_generator.generate_build_provenance(manifest)
+        att2 = attestation_generator.generate_build_provenance(manifest)
         assert att1.attestation_id != att2.attestation_id
 
     def test_build_provenance_issued_at_is_utc(
-        self, generator: AttestationGenerator, manifest: BundleManifest
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest
     ) -> None:
-        att = generator.generate_build_provenance(manifest)
+        att = attestation_generator.generate_build_provenance(manifest)
         assert att.issued_at.tzinfo is not None
 
     def test_integrity_attestation_returns_attestation(
-        self, generator: AttestationGenerator, manifest: BundleManifest, tmp_path: Path
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest, tmp_path: Path
     ) -> None:
         content = b"model weights"
         checksum = _sha256(content)
@@ -1082,11 +1202,11 @@ class TestAttestationGenerator:
             checksum=checksum,
         )
         manifest2 = _make_manifest(components=[comp])
-        att = generator.generate_integrity_attestation(manifest2, tmp_path)
+        att = attestation_generator.generate_integrity_attestation(manifest2, tmp_path)
         assert att.attestation_type == AttestationType.INTEGRITY_VERIFICATION
 
     def test_integrity_attestation_all_valid(
-        self, generator: AttestationGenerator, tmp_path: Path
+        self, attestation_generator: AttestationGenerator, tmp_path: Path
     ) -> None:
         content = b"config content"
         checksum = _sha256(content)
@@ -1095,31 +1215,31 @@ class TestAttestationGenerator:
         comp = BundleComponent("cfg", "config", "config.yaml", len(content), checksum)
         manifest = _make_manifest(components=[comp])
 
-        att = generator.generate_integrity_attestation(manifest, tmp_path)
+        att = attestation_generator.generate_integrity_attestation(manifest, tmp_path)
         assert att.claims["all_checksums_valid"] is True
         assert att.claims["passed_count"] == 1
         assert att.claims["failed_count"] == 0
 
     def test_integrity_attestation_missing_file(
-        self, generator: AttestationGenerator, tmp_path: Path
+        self, attestation_generator: AttestationGenerator, tmp_path: Path
     ) -> None:
-        comp = BundleComponent("ghost", "data", "ghost.bin", 0, "a" * 64)
+        comp = BundleComponent("ghost", "data", "ghost.bin", 0, _BAD_SHA_A)
         manifest = _make_manifest(components=[comp])
 
-        att = generator.generate_integrity_attestation(manifest, tmp_path)
+        att = attestation_generator.generate_integrity_attestation(manifest, tmp_path)
         assert att.claims["all_checksums_valid"] is False
         assert att.claims["failed_count"] == 1
 
     def test_verify_attestation_valid(
-        self, generator: AttestationGenerator, manifest: BundleManifest
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest
     ) -> None:
-        att = generator.generate_build_provenance(manifest)
-        assert generator.verify_attestation(att) is True
+        att = attestation_generator.generate_build_provenance(manifest)
+        assert attestation_generator.verify_attestation(att) is True
 
     def test_verify_attestation_tampered_claims(
-        self, generator: AttestationGenerator, manifest: BundleManifest
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest
     ) -> None:
-        att = generator.generate_build_provenance(manifest)
+        att = attestation_generator.generate_build_provenance(manifest)
         # Tamper with claims — signature will no longer match
         tampered_claims = dict(att.claims)
         tampered_claims["component_count"] = 999
@@ -1132,10 +1252,46 @@ class TestAttestationGenerator:
             claims=tampered_claims,
             signature=att.signature,
         )
-        assert generator.verify_attestation(tampered_att) is False
+        assert attestation_generator.verify_attestation(tampered_att) is False
+
+    def test_verify_attestation_detects_in_place_claim_mutation(
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest
+    ) -> None:
+        att = attestation_generator.generate_build_provenance(manifest)
+        att.claims["component_count"] = 999
+        assert attestation_generator.verify_attestation(att) is False
+
+    def test_verify_attestations_batch_preserves_order(
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest
+    ) -> None:
+        good = attestation_generator.generate_build_provenance(manifest)
+        unsigned = Attestation(
+            attestation_id="unsigned",
+            attestation_type=AttestationType.BUILD_PROVENANCE,
+            subject=manifest.bundle_id,
+            issuer="test",
+            issued_at=datetime.datetime.now(datetime.timezone.utc),
+            claims={},
+            signature=None,
+        )
+        short_sig = Attestation(
+            attestation_id=good.attestation_id,
+            attestation_type=good.attestation_type,
+            subject=good.subject,
+            issuer=good.issuer,
+            issued_at=good.issued_at,
+            claims=good.claims,
+            signature="abc",
+        )
+        assert attestation_generator.verify_attestations([good, unsigned, short_sig, good]) == [
+            True,
+            False,
+            False,
+            True,
+        ]
 
     def test_verify_attestation_none_signature(
-        self, generator: AttestationGenerator, manifest: BundleManifest
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest
     ) -> None:
         att = Attestation(
             attestation_id="test",
@@ -1146,12 +1302,12 @@ class TestAttestationGenerator:
             claims={},
             signature=None,
         )
-        assert generator.verify_attestation(att) is False
+        assert attestation_generator.verify_attestation(att) is False
 
     def test_verify_attestation_wrong_signature(
-        self, generator: AttestationGenerator, manifest: BundleManifest
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest
     ) -> None:
-        att = generator.generate_build_provenance(manifest)
+        att = attestation_generator.generate_build_provenance(manifest)
         bad_att = Attestation(
             attestation_id=att.attestation_id,
             attestation_type=att.attestation_type,
@@ -1161,58 +1317,127 @@ class TestAttestationGenerator:
             claims=att.claims,
             signature="0" * 64,
         )
-        assert generator.verify_attestation(bad_att) is False
+        assert attestation_generator.verify_attestation(bad_att) is False
 
     def test_export_and_import_attestations(
-        self, generator: AttestationGenerator, manifest: BundleManifest, tmp_path: Path
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest, tmp_path: Path
     ) -> None:
-        att = generator.generate_build_provenance(manifest)
+        att = attestation_generator.generate_build_provenance(manifest)
         export_path = tmp_path / "attestations.json"
-        generator.export_attestations([att], export_path)
+        attestation_generator.export_attestations([att], export_path)
 
-        imported = generator.import_attestations(export_path)
+        imported = attestation_generator.import_attestations(export_path)
         assert len(imported) == 1
         assert imported[0].attestation_id == att.attestation_id
         assert imported[0].attestation_type == AttestationType.BUILD_PROVENANCE
 
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_export_import_round_trip_keeps_signature_valid(
+        self,
+        attestation_generator: AttestationGenerator,
+        manifest: BundleManifest,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        use_orjson: bool,
+    ) -> None:
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(attestation_module, "_HAS_ORJSON", use_orjson)
+        att = attestation_generator.generate_build_provenance(manifest)
+        export_path = tmp_path / "attestations.json"
+        attestation_generator.export_attestations([att], export_path)
+
+        imported = AttestationGenerator().import_attestations(export_path)
+        assert imported[0].claims == att.claims
+        assert AttestationGenerator().verify_attestation(imported[0]) is True
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    @pytest.mark.parametrize(
+        ("metadata", "exported"),
+        [
+            (
+                {"built_at": datetime.datetime(2026, 1, 1)},
+                {"built_at": "2026-01-01 00:00:00"},
+            ),
+            ({"serial": 2**70}, {"serial": 2**70}),
+            ({"stage": _BuildStage.RELEASE}, {"stage": "_BuildStage.RELEASE"}),
+            (
+                {"score": float("nan"), "upper": float("inf"), "lower": float("-inf")},
+                {"score": float("nan"), "upper": float("inf"), "lower": float("-inf")},
+            ),
+        ],
+        ids=["datetime", "wide-int", "enum", "non-finite-float"],
+    )
+    def test_export_import_round_trip_with_non_native_metadata(
+        self,
+        attestation_generator: AttestationGenerator,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        use_orjson: bool,
+        metadata: dict[str, object],
+        exported: dict[str, object],
+    ) -> None:
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(attestation_module, "_HAS_ORJSON", use_orjson)
+        manifest = _make_manifest(components=[_make_component()])
+        manifest.metadata.update(metadata)
+        att = attestation_generator.generate_build_provenance(manifest)
+        export_path = tmp_path / "attestations.json"
+        attestation_generator.export_attestations([att], export_path)
+
+        raw = json.loads(export_path.read_text(encoding="utf-8"))
+        # Compared as JSON text: NaN never equals itself
+        assert json.dumps(raw[0]["claims"]["metadata"]) == json.dumps(exported)
+        imported = AttestationGenerator().import_attestations(export_path)
+        assert AttestationGenerator().verify_attestation(imported[0]) is True
+
+    def test_generated_attestations_take_the_orjson_path(
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest
+    ) -> None:
+        # Guard against the plain-JSON check quietly rejecting ordinary claims.
+        att = attestation_generator.generate_build_provenance(manifest)
+        record = attestation_module._attestation_to_dict(att)
+        assert attestation_module._is_plain_json([record]) is True
+
     def test_export_attestations_creates_valid_json(
-        self, generator: AttestationGenerator, manifest: BundleManifest, tmp_path: Path
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest, tmp_path: Path
     ) -> None:
-        att = generator.generate_build_provenance(manifest)
+        att = attestation_generator.generate_build_provenance(manifest)
         export_path = tmp_path / "att.json"
-        generator.export_attestations([att], export_path)
+        attestation_generator.export_attestations([att], export_path)
 
-        raw = json.loads(export_path.read_text(encoding="utf-8"))
+        raw = _load_json(export_path)
         assert isinstance(raw, list)
         assert raw[0]["attestation_id"] == att.attestation_id
 
     def test_import_attestations_file_not_found(
-        self, generator: AttestationGenerator, tmp_path: Path
+        self, attestation_generator: AttestationGenerator, tmp_path: Path
     ) -> None:
         with pytest.raises(FileNotFoundError):
-            generator.import_attestations(tmp_path / "missing.json")
+            attestation_generator.import_attestations(tmp_path / "missing.json")
 
     def test_export_multiple_attestations(
-        self, generator: AttestationGenerator, manifest: BundleManifest, tmp_path: Path
+        self, attestation_generator: AttestationGenerator, manifest: BundleManifest, tmp_path: Path
     ) -> None:
-        att1 = generator.generate_build_provenance(manifest)
-        att2 = generator.generate_build_provenance(manifest)
+        att1 = attestation_generator.generate_build_provenance(manifest)
+        att2 = attestation_generator.generate_build_provenance(manifest)
         export_path = tmp_path / "multi.json"
-        generator.export_attestations([att1, att2], export_path)
+        attestation_generator.export_attestations([att1, att2], export_path)
 
-        imported = generator.import_attestations(export_path)
+        imported = attestation_generator.import_attestations(export_path)
         assert len(imported) == 2
 
     def test_verify_integrity_attestation(
-        self, generator: AttestationGenerator, tmp_path: Path
+        self, attestation_generator: AttestationGenerator, tmp_path: Path
     ) -> None:
         content = b"data"
         checksum = _sha256(content)
         (tmp_path / "data.bin").write_bytes(content)
         comp = BundleComponent("d", "data", "data.bin", len(content), checksum)
         manifest = _make_manifest(components=[comp])
-        att = generator.generate_integrity_attestation(manifest, tmp_path)
-        assert generator.verify_attestation(att) is True
+        att = attestation_generator.generate_integrity_attestation(manifest, tmp_path)
+        assert attestation_generator.verify_attestation(att) is True
 
     def test_attestation_type_values(self) -> None:
         assert AttestationType.BUILD_PROVENANCE.value == "build_provenance"
@@ -1226,11 +1451,54 @@ class TestAttestationGenerator:
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def runner() -> CliRunner:
     return CliRunner()
 
 
+_BUNDLE_COMMANDS = (
+    "bundle",
+    "bundle package",
+    "bundle docker",
+    "bundle verify",
+    "bundle attest",
+)
+
+
+@pytest.fixture(scope="session")
+def help_texts(runner: CliRunner) -> dict[str, str]:
+    texts: dict[str, str] = {}
+    for command in _BUNDLE_COMMANDS:
+        result = runner.invoke(cli, [*command.split(), "--help"])
+        assert result.exit_code == 0, result.output
+        texts[command] = result.output
+    return texts
+
+
+@pytest.fixture(scope="session")
+def manifest_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # The docker and attest commands only read the manifest and write their
+    # output to a separate directory, so one file serves every test.
+    comp = _make_component(
+        name="agent-code",
+        component_type="agent_code",
+        path="src/agent.py",
+    )
+    manifest = _make_manifest(components=[comp])
+    manifest_path = tmp_path_factory.mktemp("manifest_cache") / "manifest.json"
+    manifest_path.write_text(manifest.to_json(), encoding="utf-8")
+    return manifest_path
+
+
+@pytest.fixture(scope="session")
+def bad_manifest(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # Commands reject this before writing anything, so its directory also
+    # serves as the (never-populated) output location.
+    manifest_path = tmp_path_factory.mktemp("bad_manifest") / "bad.json"
+    manifest_path.write_bytes(b"{invalid")
+    return manifest_path
+
+
 class TestBundlePackageCLI:
     def test_package_basic(self, runner: CliRunner, tmp_path: Path) -> None:
         source = tmp_path / "src"
@@ -1250,6 +1518,27 @@ class TestBundlePackageCLI:
         assert result.exit_code == 0
         assert (output / "manifest.json").exists()
 
+    def test_package_hash_algorithm_is_case_insensitive(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # With blake3 unavailable, only a correctly normalised "BLAKE3" fails.
+        monkeypatch.setitem(sys.modules, "blake3", None)
+        source = tmp_path / "src"
+        source.mkdir()
+        (source / "agent.py").write_text("x = 1")
+
+        result = runner.invoke(
+            cli,
+            [
+                "bundle", "package",
+                "--source", str(source),
+                "--output", str(tmp_path / "dist"),
+                "--hash-algorithm", "BLAKE3",
+            ],
+        )
+        assert result.exit_code == 1
+        assert "pip install agent-sovereign[blake3]" in result.output
+
     def test_package_json_output(self, runner: CliRunner, tmp_path: Path) -> None:
         source = tmp_path / "src"
         source.mkdir()
@@ -1386,18 +1675,6 @@ class TestBundlePackageCLI:
 
 
 class TestBundleDockerCLI:
-    @pytest.fixture()
-    def manifest_file(self, tmp_path: Path) -> Path:
-        comp = _make_component(
-            name="agent",
-            component_type="agent_code",
-            path="src/agent.py",
-        )
-        manifest = _make_manifest(components=[comp])
-        manifest_path = tmp_path / "manifest.json"
-        manifest_path.write_text(manifest.to_json(), encoding="utf-8")
-        return manifest_path
-
     def test_docker_generates_files(
         self, runner: CliRunner, manifest_file: Path, tmp_path: Path
     ) -> None:
@@ -1468,16 +1745,14 @@ class TestBundleDockerCLI:
         assert "my-sovereign-agent:" in compose_content
 
     def test_docker_invalid_manifest_fails(
-        self, runner: CliRunner, tmp_path: Path
+        self, runner: CliRunner, bad_manifest: Path
     ) -> None:
-        bad_manifest = tmp_path / "bad.json"
-        bad_manifest.write_text("not valid json at all {{{", encoding="utf-8")
         result = runner.invoke(
             cli,
             [
                 "bundle", "docker",
                 "--manifest", str(bad_manifest),
-                "--output", str(tmp_path / "out"),
+                "--output", str(bad_manifest.parent / "docker_out"),
             ],
         )
         assert result.exit_code != 0
@@ -1500,6 +1775,23 @@ class TestBundleDockerCLI:
         assert "HEALTHCHECK" in dockerfile_content
 
 
+@pytest.fixture()
+def blake3_manifest(tmp_path: Path) -> Path:
+    """Write a one-component manifest that records BLAKE3 checksums."""
+    bundle_dir = tmp_path / "bundle"
+    bundle_dir.mkdir()
+    (bundle_dir / "agent.py").write_bytes(b"agent code")
+    manifest = BundleManifest(
+        sovereignty_level=BundleSovereigntyLevel.PARTIAL,
+        target_platform="docker",
+        hash_algorithm="blake3",
+    )
+    manifest.add_component(BundleComponent("agent", "agent_code", "agent.py", 10, "0" * 64))
+    manifest_path = bundle_dir / "manifest.json"
+    manifest_path.write_text(manifest.to_json(), encoding="utf-8")
+    return manifest_path
+
+
 class TestBundleVerifyCLI:
     @pytest.fixture()
     def bundle_setup(self, tmp_path: Path) -> tuple[Path, Path]:
@@ -1560,7 +1852,7 @@ class TestBundleVerifyCLI:
         # File exists but checksum is wrong
         (bundle_dir / "agent.py").write_bytes(b"different content")
 
-        comp = BundleComponent("agent", "agent_code", "agent.py", 5, "a" * 64)
+        comp = BundleComponent("agent", "agent_code", "agent.py", 5, _BAD_SHA_A)
         manifest = _make_manifest(components=[comp])
         manifest_path = bundle_dir / "manifest.json"
         manifest_path.write_text(manifest.to_json(), encoding="utf-8")
@@ -1578,100 +1870,118 @@ class TestBundleVerifyCLI:
         data = json.loads(result.output)
         assert data["all_valid"] is False
 
-    def test_verify_rich_output_shows_table(
+    def test_verify_same_size_tamper_fails_checksum(
         self,
         runner: CliRunner,
         bundle_setup: tuple[Path, Path],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         manifest_path, bundle_dir = bundle_setup
+        # Same byte length as the original, so only the digest can catch it
+        (bundle_dir / "agent.py").write_bytes(b"agent kode")
+        hashed: list[Path] = []
+        real_checksum = manifest_module.file_checksum
+
+        def _spy(file_path: Path, algorithm: HashAlgorithm = "sha256") -> str:
+            hashed.append(file_path)
+            return real_checksum(file_path, algorithm)
+
+        monkeypatch.setattr(manifest_module, "file_checksum", _spy)
         result = runner.invoke(
             cli,
             [
                 "bundle", "verify",
                 "--manifest", str(manifest_path),
                 "--bundle-dir", str(bundle_dir),
+                "--json-output",
             ],
         )
-        assert "agent" in result.output
-
-
-class TestBundleAttestCLI:
-    @pytest.fixture()
-    def manifest_file(self, tmp_path: Path) -> Path:
-        comp = _make_component(
-            name="agent-code",
-            component_type="agent_code",
-            path="src/agent.py",
-        )
-        manifest = _make_manifest(components=[comp])
-        manifest_path = tmp_path / "manifest.json"
-        manifest_path.write_text(manifest.to_json(), encoding="utf-8")
-        return manifest_path
+        assert result.exit_code != 0
+        data = json.loads(result.output)
+        assert data["results"] == [{"component": "agent", "valid": False}]
+        assert hashed == [bundle_dir / "agent.py"]
 
-    def test_attest_creates_output_file(
-        self, runner: CliRunner, manifest_file: Path, tmp_path: Path
+    def test_verify_blake3_manifest_without_extra_exits_one(
+        self,
+        runner: CliRunner,
+        blake3_manifest: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        output_path = tmp_path / "attestations.json"
+        monkeypatch.setitem(sys.modules, "blake3", None)
         result = runner.invoke(
             cli,
             [
-                "bundle", "attest",
-                "--manifest", str(manifest_file),
-                "--output", str(output_path),
+                "bundle", "verify",
+                "--manifest", str(blake3_manifest),
+                "--bundle-dir", str(blake3_manifest.parent),
             ],
         )
-        assert result.exit_code == 0
-        assert output_path.exists()
+        assert result.exit_code == 1
+        assert isinstance(result.exception, SystemExit)
+        assert "Verification error" in result.output
+        assert "pip install agent-sovereign[blake3]" in result.output
 
-    def test_attest_json_output(
-        self, runner: CliRunner, manifest_file: Path, tmp_path: Path
+    def test_verify_rich_output_shows_table(
+        self,
+        runner: CliRunner,
+        bundle_setup: tuple[Path, Path],
     ) -> None:
-        output_path = tmp_path / "attestations.json"
+        manifest_path, bundle_dir = bundle_setup
         result = runner.invoke(
             cli,
             [
-                "bundle", "attest",
-                "--manifest", str(manifest_file),
-                "--output", str(output_path),
-                "--json-output",
+                "bundle", "verify",
+                "--manifest", str(manifest_path),
+                "--bundle-dir", str(bundle_dir),
             ],
         )
-        assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert "bundle_id" in data
-        assert "attestation_count" in data
-        assert data["attestation_count"] == 2
-        assert "attestations" in data
+        assert "agent" in result.output
 
-    def test_attest_output_file_is_valid_json(
-        self, runner: CliRunner, manifest_file: Path, tmp_path: Path
-    ) -> None:
-        output_path = tmp_path / "attestations.json"
-        runner.invoke(
-            cli,
-            [
-                "bundle", "attest",
-                "--manifest", str(manifest_file),
-                "--output", str(output_path),
-            ],
-        )
-        raw = json.loads(output_path.read_text(encoding="utf-8"))
-        assert isinstance(raw, list)
-        assert len(raw) == 2
 
-    def test_attest_output_has_required_fields(
-        self, runner: CliRunner, manifest_file: Path, tmp_path: Path
-    ) -> None:
-        output_path = tmp_path / "attestations.json"
-        runner.invoke(
-            cli,
-            [
-                "bundle", "attest",
-                "--manifest", str(manifest_file),
-                "--output", str(output_path),
-            ],
-        )
-        attestations = json.loads(output_path.read_text(encoding="utf-8"))
+# (CLI result, parsed --json-output summary, exported attestations path)
+_AttestRun = tuple[Result, dict[str, Any], Path]
+
+
+@pytest.fixture(scope="module")
+def attest_out_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # One directory for every attest invocation; each test writes its own file.
+    return tmp_path_factory.mktemp("attest_out")
+
+
+@pytest.fixture(scope="module")
+def attest_run(
+    runner: CliRunner,
+    manifest_file: Path,
+    attest_out_dir: Path,
+) -> _AttestRun:
+    """Invoke ``bundle attest`` once; return (result, summary, attestations_path).
+
+    The command runs with ``standalone_mode=False`` so the summary is taken
+    from its return value rather than parsed back out of ``result.output``.
+    """
+    output_path = attest_out_dir / "attestations.json"
+    result = runner.invoke(
+        cli,
+        [
+            "bundle", "attest",
+            "--manifest", str(manifest_file),
+            "--output", str(output_path),
+            "--issuer", "my-ci-pipeline",
+            "--json-output",
+        ],
+        standalone_mode=False,
+    )
+    assert result.exit_code == 0, result.output
+    return result, result.return_value, output_path
+
+
+class TestBundleAttestCLI:
+    def test_attest_writes_attestation_file(self, attest_run: _AttestRun) -> None:
+        # The only test that reads the exported file; the rest use the summary.
+        _, _, output_path = attest_run
+        attestations = _load_json(output_path)
+        assert isinstance(attestations, list)
+        assert len(attestations) == 2
         for att in attestations:
             assert "attestation_id" in att
             assert "attestation_type" in att
@@ -1679,46 +1989,74 @@ class TestBundleAttestCLI:
             assert "issuer" in att
             assert "issued_at" in att
 
-    def test_attest_custom_issuer(
-        self, runner: CliRunner, manifest_file: Path, tmp_path: Path
+    def test_attest_json_output(self, attest_run: _AttestRun) -> None:
+        result, summary, _ = attest_run
+        # The only test that parses stdout; it must match the returned summary.
+        assert json.loads(result.output) == summary
+        assert "bundle_id" in summary
+        assert "attestation_count" in summary
+        assert summary["attestation_count"] == 2
+        assert "attestations" in summary
+
+    def test_attest_json_output_has_required_fields(
+        self, attest_run: _AttestRun
+    ) -> None:
+        _, summary, _ = attest_run
+        for att in summary["attestations"]:
+            assert "attestation_id" in att
+            assert "attestation_type" in att
+            assert "issuer" in att
+            assert "issued_at" in att
+
+    def test_attest_custom_issuer(self, attest_run: _AttestRun) -> None:
+        _, summary, _ = attest_run
+        assert all(
+            att["issuer"] == "my-ci-pipeline"
+            for att in summary["attestations"]
+        )
+
+    def test_attest_blake3_manifest_without_extra_exits_one(
+        self,
+        runner: CliRunner,
+        blake3_manifest: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        output_path = tmp_path / "attestations.json"
+        monkeypatch.setitem(sys.modules, "blake3", None)
         result = runner.invoke(
             cli,
             [
                 "bundle", "attest",
-                "--manifest", str(manifest_file),
-                "--output", str(output_path),
-                "--issuer", "my-ci-pipeline",
-                "--json-output",
+                "--manifest", str(blake3_manifest),
+                "--output", str(blake3_manifest.parent / "attestations.json"),
             ],
         )
-        assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert all(
-            att["issuer"] == "my-ci-pipeline"
-            for att in data["attestations"]
-        )
+        assert result.exit_code == 1
+        assert isinstance(result.exception, SystemExit)
+        assert "Attestation error" in result.output
+        assert "pip install agent-sovereign[blake3]" in result.output
 
+    @pytest.mark.slow
     def test_attest_invalid_manifest_fails(
-        self, runner: CliRunner, tmp_path: Path
+        self, runner: CliRunner, bad_manifest: Path
     ) -> None:
-        bad_manifest = tmp_path / "bad.json"
-        bad_manifest.write_text("{invalid", encoding="utf-8")
         result = runner.invoke(
             cli,
             [
                 "bundle", "attest",
                 "--manifest", str(bad_manifest),
-                "--output", str(tmp_path / "out.json"),
+                "--output", str(bad_manifest.parent / "out.json"),
             ],
         )
         assert result.exit_code != 0
 
     def test_attest_rich_output_mentions_attestation_count(
-        self, runner: CliRunner, manifest_file: Path, tmp_path: Path
+        self,
+        runner: CliRunner,
+        manifest_file: Path,
+        attest_out_dir: Path,
+        request: pytest.FixtureRequest,
     ) -> None:
-        output_path = tmp_path / "attestations.json"
+        output_path = attest_out_dir / f"{request.node.name}.json"
         result = runner.invoke(
             cli,
             [
@@ -1732,32 +2070,24 @@ class TestBundleAttestCLI:
 
 
 class TestBundleGroupCLI:
-    def test_bundle_group_shows_help(self, runner: CliRunner) -> None:
-        result = runner.invoke(cli, ["bundle", "--help"])
-        assert result.exit_code == 0
-        assert "package" in result.output
-        assert "docker" in result.output
-        assert "verify" in result.output
-        assert "attest" in result.output
-
-    def test_bundle_package_shows_help(self, runner: CliRunner) -> None:
-        result = runner.invoke(cli, ["bundle", "package", "--help"])
-        assert result.exit_code == 0
-        assert "--source" in result.output
-        assert "--output" in result.output
-        assert "--sovereignty" in result.output
-
-    def test_bundle_docker_shows_help(self, runner: CliRunner) -> None:
-        result = runner.invoke(cli, ["bundle", "docker", "--help"])
-        assert result.exit_code == 0
-        assert "--manifest" in result.output
-
-    def test_bundle_verify_shows_help(self, runner: CliRunner) -> None:
-        result = runner.invoke(cli, ["bundle", "verify", "--help"])
-        assert result.exit_code == 0
-        assert "--bundle-dir" in result.output
-
-    def test_bundle_attest_shows_help(self, runner: CliRunner) -> None:
-        result = runner.invoke(cli, ["bundle", "attest", "--help"])
-        assert result.exit_code == 0
-        assert "--issuer" in result.output
+    def test_bundle_group_shows_help(self, help_texts: dict[str, str]) -> None:
+        output = help_texts["bundle"]
+        assert "package" in output
+        assert "docker" in output
+        assert "verify" in output
+        assert "attest" in output
+
+    def test_bundle_package_shows_help(self, help_texts: dict[str, str]) -> None:
+        output = help_texts["bundle package"]
+        assert "--source" in output
+        assert "--output" in output
+        assert "--sovereignty" in output
+
+    def test_bundle_docker_shows_help(self, help_texts: dict[str, str]) -> None:
+        assert "--manifest" in help_texts["bundle docker"]
+
+    def test_bundle_verify_shows_help(self, help_texts: dict[str, str]) -> None:
+        assert "--bundle-dir" in help_texts["bundle verify"]
+
+    def test_bundle_attest_shows_help(self, help_texts: dict[str, str]) -> None:
+        assert "--issuer" in help_texts["bundle attest"]
@@ -11,21 +11,46 @@ from agent_sovereign.classifier.levels import (
     get_level_description,
 )
 
+_ALL_LEVELS: tuple[SovereigntyLevel, ...] = tuple(SovereigntyLevel)
+
+_EXPECTED_REQ_KEYS = frozenset(
+    {
+        "network_access",
+        "data_storage",
+        "encryption_at_rest",
+        "encryption_in_transit",
+        "model_hosting",
+        "audit_logging",
+        "key_management",
+        "update_mechanism",
+    }
+)
+
 
 class TestSovereigntyLevelEnum:
     def test_all_seven_levels_exist(self) -> None:
-        levels = list(SovereigntyLevel)
-        assert len(levels) == 7
-
-    def test_l1_is_lowest(self) -> None:
-        assert SovereigntyLevel.L1_CLOUD == 1
-
-    def test_l7_is_highest(self) -> None:
-        assert SovereigntyLevel.L7_AIRGAPPED == 7
+        assert len(_ALL_LEVELS) == 7
+
+    @pytest.mark.parametrize(
+        ("value", "name"),
+        [
+            (1, "L1_CLOUD"),
+            (2, "L2_CLOUD_DEDICATED"),
+            (3, "L3_HYBRID"),
+            (4, "L4_LOCAL_AUGMENTED"),
+            (5, "L5_FULLY_LOCAL"),
+            (6, "L6_CLASSIFIED"),
+            (7, "L7_AIRGAPPED"),
+        ],
+    )
+    def test_level_mapping(self, value: int, name: str) -> None:
+        level = SovereigntyLevel(value)
+        assert level.value == value
+        assert level.name == name
+        assert SovereigntyLevel[name] is level
 
     def test_levels_are_ordered_ascending(self) -> None:
-        levels = list(SovereigntyLevel)
-        values = [level.value for level in levels]
+        values = [level.value for level in _ALL_LEVELS]
         assert values == sorted(values)
 
     def test_l1_less_than_l7(self) -> None:
@@ -36,27 +61,13 @@ class TestSovereigntyLevelEnum:
         assert SovereigntyLevel.L4_LOCAL_AUGMENTED < SovereigntyLevel.L5_FULLY_LOCAL
 
     def test_all_level_names_contain_prefix(self) -> None:
-        for level in SovereigntyLevel:
+        for level in _ALL_LEVELS:
             assert level.name.startswith("L")
 
-    def test_level_from_integer(self) -> None:
-        assert SovereigntyLevel(3) == SovereigntyLevel.L3_HYBRID
-
-    def test_level_from_integer_all_values(self) -> None:
-        for expected_value in range(1, 8):
-            level = SovereigntyLevel(expected_value)
-            assert level.value == expected_value
-
     def test_integer_comparison(self) -> None:
         assert SovereigntyLevel.L5_FULLY_LOCAL >= 5
         assert SovereigntyLevel.L2_CLOUD_DEDICATED < 3
 
-    def test_l6_classified_name(self) -> None:
-        assert SovereigntyLevel.L6_CLASSIFIED.name == "L6_CLASSIFIED"
-
-    def test_l7_airgapped_name(self) -> None:
-        assert SovereigntyLevel.L7_AIRGAPPED.name == "L7_AIRGAPPED"
-
     def test_max_of_levels(self) -> None:
         result = max(SovereigntyLevel.L2_CLOUD_DEDICATED, SovereigntyLevel.L5_FULLY_LOCAL)
         assert result == SovereigntyLevel.L5_FULLY_LOCAL
@@ -68,7 +79,7 @@ class TestSovereigntyLevelEnum:
 
 class TestLevelDescriptions:
     def test_every_level_has_a_description(self) -> None:
-        for level in SovereigntyLevel:
+        for level in _ALL_LEVELS:
             assert level in LEVEL_DESCRIPTIONS
 
     def test_descriptions_are_non_empty_strings(self) -> None:
@@ -89,29 +100,19 @@ class TestLevelDescriptions:
         assert "air" in description.lower()
 
     def test_descriptions_differ_per_level(self) -> None:
-        descriptions = [get_level_description(level) for level in SovereigntyLevel]
+        descriptions = [get_level_description(level) for level in _ALL_LEVELS]
         assert len(set(descriptions)) == 7
 
 
 class TestCapabilityRequirements:
     def test_every_level_has_capability_requirements(self) -> None:
-        for level in SovereigntyLevel:
+        for level in _ALL_LEVELS:
             assert level in CAPABILITY_REQUIREMENTS
 
     def test_each_requirement_has_eight_keys(self) -> None:
-        expected_keys = {
-            "network_access",
-            "data_storage",
-            "encryption_at_rest",
-            "encryption_in_transit",
-            "model_hosting",
-            "audit_logging",
-            "key_management",
-            "update_mechanism",
-        }
-        for level in SovereigntyLevel:
+        for level in _ALL_LEVELS:
             reqs = CAPABILITY_REQUIREMENTS[level]
-            assert set(reqs.keys()) == expected_keys
+            assert reqs.keys() == _EXPECTED_REQ_KEYS
 
     def test_get_capability_requirements_returns_dict(self) -> None:
         reqs = get_capability_requirements(SovereigntyLevel.L3_HYBRID)
@@ -1,8 +1,12 @@
 """Unit tests for agent_sovereign.classifier.rules."""
 from __future__ import annotations
 
+import dataclasses
+from typing import Any
+
 import pytest
 
+from agent_sovereign.classifier import rules as rules_module
 from agent_sovereign.classifier.levels import SovereigntyLevel
 from agent_sovereign.classifier.rules import (
     ClassificationRule,
@@ -10,149 +14,174 @@ from agent_sovereign.classifier.rules import (
     RuleMatchResult,
 )
 
+_EMPTY_RULE = ClassificationRule(
+    rule_id="test_rule",
+    description="A test rule",
+    minimum_level=3,
+)
 
-class TestClassificationRuleMatches:
-    def _make_rule(
-        self,
-        data_types: list[str] | None = None,
-        regulations: list[str] | None = None,
-        geographies: list[str] | None = None,
-        minimum_level: int = 3,
-    ) -> ClassificationRule:
-        return ClassificationRule(
-            rule_id="test_rule",
-            description="A test rule",
-            minimum_level=minimum_level,
-            data_types=data_types or [],
-            regulations=regulations or [],
-            geographies=geographies or [],
-        )
 
-    def test_empty_rule_matches_everything(self) -> None:
-        rule = self._make_rule()
-        assert rule.matches(["phi"], ["HIPAA"], "EU") is True
+# matches() is pure, so identical rules are built once and shared across cases.
+_RULE_CACHE: dict[tuple[tuple[str, Any], ...], ClassificationRule] = {}
 
-    def test_empty_rule_matches_empty_inputs(self) -> None:
-        rule = self._make_rule()
-        assert rule.matches([], [], None) is True
 
-    def test_data_type_match_succeeds(self) -> None:
-        rule = self._make_rule(data_types=["phi"])
-        assert rule.matches(["phi", "medical_records"], [], None) is True
+def _make_rule(**overrides: Any) -> ClassificationRule:
+    key = tuple(
+        sorted(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in overrides.items()
+        )
+    )
+    rule = _RULE_CACHE.get(key)
+    if rule is None:
+        rule = _RULE_CACHE[key] = dataclasses.replace(_EMPTY_RULE, **overrides)
+    return rule
 
-    def test_data_type_match_fails_when_not_present(self) -> None:
-        rule = self._make_rule(data_types=["classified"])
-        assert rule.matches(["phi"], [], None) is False
 
-    def test_regulation_match_succeeds(self) -> None:
-        rule = self._make_rule(regulations=["HIPAA"])
-        assert rule.matches([], ["HIPAA", "GDPR"], None) is True
+_ALL_CONDITIONS = {"data_types": ["phi"], "regulations": ["HIPAA"], "geographies": ["US"]}
 
-    def test_regulation_match_fails(self) -> None:
-        rule = self._make_rule(regulations=["ITAR"])
-        assert rule.matches([], ["HIPAA"], None) is False
 
-    def test_geography_match_succeeds(self) -> None:
-        rule = self._make_rule(geographies=["EU", "EEA"])
-        assert rule.matches([], [], "EU") is True
+class TestClassificationRuleMatches:
+    @pytest.mark.parametrize(
+        ("overrides", "data_types", "regulations", "geography", "expected"),
+        [
+            ({}, ["phi"], ["HIPAA"], "EU", True),
+            ({}, [], [], None, True),
+            ({"data_types": ["phi"]}, ["phi", "medical_records"], [], None, True),
+            ({"data_types": ["classified"]}, ["phi"], [], None, False),
+            ({"regulations": ["HIPAA"]}, [], ["HIPAA", "GDPR"], None, True),
+            ({"regulations": ["ITAR"]}, [], ["HIPAA"], None, False),
+            ({"geographies": ["EU", "EEA"]}, [], [], "EU", True),
+            ({"geographies": ["EU"]}, [], [], "US", False),
+            ({"geographies": ["EU"]}, [], [], None, False),
+            (_ALL_CONDITIONS, ["phi"], ["HIPAA"], "US", True),
+            (_ALL_CONDITIONS, ["phi"], ["HIPAA"], "EU", False),
+            (_ALL_CONDITIONS, ["phi"], [], "US", False),
+            (_ALL_CONDITIONS, [], ["HIPAA"], "US", False),
+        ],
+        ids=[
+            "empty-rule-matches-everything",
+            "empty-rule-matches-empty-inputs",
+            "data-type-match",
+            "data-type-missing",
+            "regulation-match",
+            "regulation-missing",
+            "geography-match",
+            "geography-mismatch",
+            "geography-none-when-required",
+            "all-conditions-met",
+            "all-conditions-wrong-geography",
+            "all-conditions-missing-regulation",
+            "all-conditions-missing-data-type",
+        ],
+    )
+    def test_matches(
+        self,
+        overrides: dict[str, list[str]],
+        data_types: list[str],
+        regulations: list[str],
+        geography: str | None,
+        expected: bool,
+    ) -> None:
+        rule = _make_rule(**overrides) if overrides else _EMPTY_RULE
+        assert rule.matches(data_types, regulations, geography) is expected
 
-    def test_geography_match_fails(self) -> None:
-        rule = self._make_rule(geographies=["EU"])
-        assert rule.matches([], [], "US") is False
+    def test_rule_is_slotted(self) -> None:
+        assert not hasattr(_EMPTY_RULE, "__dict__")
 
-    def test_geography_none_fails_when_required(self) -> None:
-        rule = self._make_rule(geographies=["EU"])
-        assert rule.matches([], [], None) is False
 
-    def test_all_conditions_must_be_met(self) -> None:
-        rule = self._make_rule(
-            data_types=["phi"],
-            regulations=["HIPAA"],
-            geographies=["US"],
-        )
-        # All three match
-        assert rule.matches(["phi"], ["HIPAA"], "US") is True
-        # Missing geography
-        assert rule.matches(["phi"], ["HIPAA"], "EU") is False
-        # Missing regulation
-        assert rule.matches(["phi"], [], "US") is False
-        # Missing data type
-        assert rule.matches([], ["HIPAA"], "US") is False
+@pytest.fixture(scope="class")
+def engine() -> ClassificationRules:
+    # Parsing the bundled YAML dominates these tests; the engine is only read.
+    return ClassificationRules()
 
 
-class TestClassificationRulesDefaultRules:
-    def setup_method(self) -> None:
-        self.engine = ClassificationRules()
-
-    def test_default_rules_loads_without_error(self) -> None:
-        assert len(self.engine.rules) > 0
+@pytest.fixture(scope="class")
+def phi_result(engine: ClassificationRules) -> RuleMatchResult:
+    return engine.evaluate(data_types=["phi"], regulations=[], geography=None)
 
-    def test_rules_property_returns_copy(self) -> None:
-        rules_a = self.engine.rules
-        rules_b = self.engine.rules
-        assert rules_a is not rules_b
 
-    def test_phi_data_type_raises_level(self) -> None:
-        result = self.engine.evaluate(data_types=["phi"], regulations=[], geography=None)
-        assert result.rule_driven_level >= SovereigntyLevel.L5_FULLY_LOCAL
+@pytest.fixture(scope="class")
+def classified_result(engine: ClassificationRules) -> RuleMatchResult:
+    return engine.evaluate(data_types=["classified"], regulations=[], geography=None)
 
-    def test_classified_data_requires_l7(self) -> None:
-        result = self.engine.evaluate(data_types=["classified"], regulations=[], geography=None)
-        assert result.rule_driven_level == SovereigntyLevel.L7_AIRGAPPED
 
-    def test_itar_data_requires_l7(self) -> None:
-        result = self.engine.evaluate(
-            data_types=["itar_technical_data"], regulations=[], geography=None
-        )
-        assert result.rule_driven_level == SovereigntyLevel.L7_AIRGAPPED
+class TestClassificationRulesDefaultRules:
+    def test_default_rules_loads_without_error(self, engine: ClassificationRules) -> None:
+        assert len(engine.rules) > 0
 
-    def test_biometric_data_requires_at_least_l5(self) -> None:
-        result = self.engine.evaluate(
-            data_types=["biometric_data"], regulations=[], geography=None
-        )
-        assert result.rule_driven_level >= SovereigntyLevel.L5_FULLY_LOCAL
+    def test_rules_property_returns_copy(self, engine: ClassificationRules) -> None:
+        rules_a = engine.rules
+        rules_b = engine.rules
+        assert rules_a is not rules_b
 
-    def test_genetic_data_requires_at_least_l5(self) -> None:
-        result = self.engine.evaluate(
-            data_types=["genetic_data"], regulations=[], geography=None
+    @pytest.mark.parametrize(
+        ("data_types", "regulations", "geography", "minimum_level", "rule_id"),
+        [
+            (["phi"], [], None, SovereigntyLevel.L5_FULLY_LOCAL, "phi_always_l5"),
+            (["classified"], [], None, SovereigntyLevel.L7_AIRGAPPED, "classified_airgap"),
+            (
+                ["itar_technical_data"],
+                [],
+                None,
+                SovereigntyLevel.L7_AIRGAPPED,
+                "classified_airgap",
+            ),
+            (["biometric_data"], [], None, SovereigntyLevel.L5_FULLY_LOCAL, "biometric_strict"),
+            (["genetic_data"], [], None, SovereigntyLevel.L5_FULLY_LOCAL, "biometric_strict"),
+            (
+                ["phi", "medical_records"],
+                ["HIPAA"],
+                None,
+                SovereigntyLevel.L4_LOCAL_AUGMENTED,
+                "hipaa_phi_combination",
+            ),
+            ([], ["GDPR"], "EU", SovereigntyLevel.L6_CLASSIFIED, "gdpr_eu_combination"),
+        ],
+        ids=["phi", "classified", "itar", "biometric", "genetic", "hipaa-phi", "gdpr-eu"],
+    )
+    def test_evaluate_default_rules(
+        self,
+        engine: ClassificationRules,
+        data_types: list[str],
+        regulations: list[str],
+        geography: str | None,
+        minimum_level: SovereigntyLevel,
+        rule_id: str,
+    ) -> None:
+        result = engine.evaluate(
+            data_types=data_types, regulations=regulations, geography=geography
         )
-        assert result.rule_driven_level >= SovereigntyLevel.L5_FULLY_LOCAL
+        assert result.rule_driven_level >= minimum_level
+        assert any(r.rule_id == rule_id for r in result.matched_rules)
 
-    def test_hipaa_with_phi_fires_combination_rule(self) -> None:
-        result = self.engine.evaluate(
-            data_types=["phi", "medical_records"],
-            regulations=["HIPAA"],
-            geography=None,
-        )
-        assert result.rule_driven_level >= SovereigntyLevel.L4_LOCAL_AUGMENTED
-        assert any("hipaa_phi_combination" == r.rule_id for r in result.matched_rules)
+    def test_no_match_returns_l1(self, engine: ClassificationRules) -> None:
+        result = engine.evaluate(data_types=[], regulations=[], geography=None)
+        assert result.rule_driven_level == SovereigntyLevel.L1_CLOUD
 
-    def test_gdpr_in_eu_fires_combination_rule(self) -> None:
-        result = self.engine.evaluate(
-            data_types=[],
-            regulations=["GDPR"],
-            geography="EU",
-        )
-        assert result.rule_driven_level >= SovereigntyLevel.L6_CLASSIFIED
+    def test_justifications_populated_for_matched_rules(
+        self, phi_result: RuleMatchResult
+    ) -> None:
+        assert len(phi_result.rule_justifications) > 0
 
-    def test_no_match_returns_l1(self) -> None:
-        result = self.engine.evaluate(data_types=[], regulations=[], geography=None)
-        assert result.rule_driven_level == SovereigntyLevel.L1_CLOUD
+    def test_one_justification_per_matched_rule(self, phi_result: RuleMatchResult) -> None:
+        assert len(phi_result.rule_justifications) == len(phi_result.matched_rules)
 
-    def test_justifications_populated_for_matched_rules(self) -> None:
-        result = self.engine.evaluate(data_types=["phi"], regulations=[], geography=None)
-        assert len(result.rule_justifications) > 0
+    def test_matched_rules_contains_correct_rule_ids(
+        self, classified_result: RuleMatchResult
+    ) -> None:
+        matched_ids = [r.rule_id for r in classified_result.matched_rules]
+        assert "classified_airgap" in matched_ids
 
-    def test_matched_rules_contains_correct_rule_ids(self) -> None:
-        result = self.engine.evaluate(
-            data_types=["classified"], regulations=[], geography=None
+    def test_justifications_name_matched_rules(
+        self, classified_result: RuleMatchResult
+    ) -> None:
+        assert any(
+            "'classified_airgap'" in reason for reason in classified_result.rule_justifications
         )
-        matched_ids = [r.rule_id for r in result.matched_rules]
-        assert "classified_airgap" in matched_ids
 
 
-class TestClassificationRulesFromYamlString:
-    _CUSTOM_YAML = """\
+_CUSTOM_YAML = """\
 version: "1.0"
 rules:
   - id: custom_rule_1
@@ -161,14 +190,23 @@ rules:
     minimum_level: 4
 """
 
-    def test_load_from_yaml_string_succeeds(self) -> None:
-        engine = ClassificationRules(yaml_source=self._CUSTOM_YAML)
-        assert len(engine.rules) == 1
-        assert engine.rules[0].rule_id == "custom_rule_1"
 
-    def test_custom_rule_fires(self) -> None:
-        engine = ClassificationRules(yaml_source=self._CUSTOM_YAML)
-        result = engine.evaluate(data_types=["test_data"], regulations=[], geography=None)
+@pytest.fixture(scope="class")
+def custom_yaml_engine() -> ClassificationRules:
+    return ClassificationRules(yaml_source=_CUSTOM_YAML)
+
+
+class TestClassificationRulesFromYamlString:
+    def test_load_from_yaml_string_succeeds(
+        self, custom_yaml_engine: ClassificationRules
+    ) -> None:
+        assert len(custom_yaml_engine.rules) == 1
+        assert custom_yaml_engine.rules[0].rule_id == "custom_rule_1"
+
+    def test_custom_rule_fires(self, custom_yaml_engine: ClassificationRules) -> None:
+        result = custom_yaml_engine.evaluate(
+            data_types=["test_data"], regulations=[], geography=None
+        )
         assert result.rule_driven_level >= SovereigntyLevel.L4_LOCAL_AUGMENTED
 
     def test_invalid_yaml_missing_rules_key_raises(self) -> None:
@@ -177,6 +215,23 @@ rules:
             ClassificationRules(yaml_source=bad_yaml)
 
 
+class TestClassificationRulesParseCache:
+    def test_same_yaml_is_parsed_once(self) -> None:
+        rules_module._parse_rules_yaml.cache_clear()
+        ClassificationRules(yaml_source=_CUSTOM_YAML)
+        ClassificationRules(yaml_source=_CUSTOM_YAML)
+        info = rules_module._parse_rules_yaml.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_engines_do_not_share_rule_objects(self) -> None:
+        first = ClassificationRules()
+        second = ClassificationRules()
+        first.rules[0].data_types.append("mutated")
+        assert first.rules[0] is not second.rules[0]
+        assert "mutated" not in second.rules[0].data_types
+
+
 class TestClassificationRulesFromFile:
     def test_load_from_path_object(self, tmp_path: pytest.TempPathFactory) -> None:
         import pathlib
@@ -1,8 +1,11 @@
 """Unit tests for agent_sovereign.classifier.sensitivity."""
 from __future__ import annotations
 
+import re
+
 import pytest
 
+from agent_sovereign.classifier import sensitivity as sensitivity_module
 from agent_sovereign.classifier.levels import SovereigntyLevel
 from agent_sovereign.classifier.sensitivity import (
     DATA_SENSITIVITY,
@@ -34,6 +37,90 @@ class TestDataSensitivityMapping:
         assert DATA_SENSITIVITY["itar_technical_data"] == 7
 
 
+class TestBuiltinPatterns:
+    def test_case_insensitive_patterns_are_written_in_lowercase(self) -> None:
+        # The prefilter matches these against lowercased text without
+        # IGNORECASE, which is only equivalent for lowercase sources.
+        for patterns in sensitivity_module._DETECTION_PATTERNS.values():
+            for pattern in patterns:
+                if pattern.flags & re.IGNORECASE:
+                    assert pattern.pattern == pattern.pattern.lower()
+
+    def test_lowercase_twins_mirror_builtins_without_ignorecase(self) -> None:
+        builtins = sensitivity_module._DETECTION_PATTERNS
+        twins = sensitivity_module._LOWERCASE_PATTERNS
+        assert list(twins) == sorted(builtins)
+        for data_type, patterns in builtins.items():
+            assert [p.pattern for p in twins[data_type]] == [p.pattern for p in patterns]
+            assert not any(p.flags & re.IGNORECASE for p in twins[data_type])
+
+    def test_patterns_are_re2_compatible(self) -> None:
+        # No lookarounds or backreferences, so the built-ins stay portable to
+        # linear-time engines such as RE2 and Hyperscan.
+        unsupported = re.compile(r"\(\?<?[=!]|\\[1-9]|\(\?P=")
+        for patterns in sensitivity_module._DETECTION_PATTERNS.values():
+            for pattern in patterns:
+                assert not unsupported.search(pattern.pattern), pattern.pattern
+
+
+class TestEmailCounting:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "a@b.com c@d.org",
+            "_a.b@x.com",
+            "x.y.z@@a.b.cc..@q.io",
+            "a." * 50 + "@host.example",
+            "-@x.com .a@x.com a@x.c",
+            "naïve.user@example.com",
+        ],
+    )
+    def test_count_matches_findall(self, text: str) -> None:
+        pattern = sensitivity_module._EMAIL_PATTERN
+        for pos in range(len(text) + 1):
+            expected = len(pattern.findall(text, pos))
+            assert sensitivity_module._count_emails(pattern, text, pos) == expected
+
+    def test_email_runs_without_prefilter_hit(self, detector: DataSensitivityDetector) -> None:
+        assert detector.scan("reach me at someone@example.com").detected_types == [
+            "customer_email"
+        ]
+
+
+class TestUnboundedTwins:
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [
+            (r"\bcard(?:holder|num)\b", r"card(?:holder|num)\b"),
+            (r"\bcvv\b|\bcvc\b", r"cvv\b|cvc\b"),
+            (r"\b(?:a|\bb)\b", r"(?:a|\bb)\b"),
+            (r"\bcvv\b|cvc\b", None),
+            (r"\b[a-z]+@x", None),
+            (r"\b\d{3}", None),
+            (r"card\b", None),
+        ],
+        ids=["group", "branches", "nested-branch", "unbounded-branch", "class", "escape", "plain"],
+    )
+    def test_without_leading_boundary(self, source: str, expected: str | None) -> None:
+        assert sensitivity_module._without_leading_boundary(source) == expected
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "discardholder cardnumber _card card_ card",
+            "xcvv cvv2 cvv2x cvc cvv",
+            "outpatient chart, patient id, patient_id",
+            "x4111111111111111 4111111111111111 41111111111111112",
+            "stop secret top secret",
+        ],
+    )
+    def test_counts_match_findall(self, text: str) -> None:
+        for pattern in sensitivity_module._UNBOUNDED_TWINS:
+            for pos in (0, 5):
+                expected = len(pattern.findall(text, pos))
+                assert sensitivity_module._count_matches(pattern, text, pos) == expected
+
+
 class TestDetectionResult:
     def test_default_sovereignty_level_is_l1(self) -> None:
         result = DetectionResult()
@@ -47,136 +134,299 @@ class TestDetectionResult:
         result = DetectionResult()
         assert result.detected_types == []
 
+    def test_result_is_slotted(self) -> None:
+        assert not hasattr(DetectionResult(), "__dict__")
 
-class TestDataSensitivityDetectorScan:
-    def setup_method(self) -> None:
-        self.detector = DataSensitivityDetector()
 
-    def test_scan_empty_string_returns_l1(self) -> None:
-        result = self.detector.scan("")
+@pytest.fixture(scope="module")
+def detector() -> DataSensitivityDetector:
+    # Detectors hold no per-scan state, so one instance serves every read-only test.
+    return DataSensitivityDetector()
+
+
+class TestDataSensitivityDetectorScan:
+    def test_scan_empty_string_returns_l1(self, detector: DataSensitivityDetector) -> None:
+        result = detector.scan("")
         assert result.sovereignty_level == SovereigntyLevel.L1_CLOUD
         assert result.detected_types == []
 
-    def test_scan_plain_text_returns_l1(self) -> None:
-        result = self.detector.scan("The quick brown fox jumps over the lazy dog.")
+    def test_scan_single_characters_never_match(
+        self, detector: DataSensitivityDetector
+    ) -> None:
+        # Guards _MIN_BUILTIN_MATCH_LEN: no built-in pattern matches one character.
+        for char in map(chr, range(0x250)):
+            assert detector.scan(char).detected_types == []
+            for patterns in sensitivity_module._DETECTION_PATTERNS.values():
+                assert not any(p.search(char) for p in patterns)
+
+    def test_scan_shortest_builtin_match_detected(
+        self, detector: DataSensitivityDetector
+    ) -> None:
+        assert detector.scan("W2").detected_types == ["financial_data"]
+
+    def test_scan_plain_text_returns_l1(self, detector: DataSensitivityDetector) -> None:
+        result = detector.scan("The quick brown fox jumps over the lazy dog.")
         assert result.sovereignty_level == SovereigntyLevel.L1_CLOUD
 
-    def test_scan_detects_email_address(self) -> None:
-        result = self.detector.scan("Contact us at alice@example.com for support.")
+    def test_scan_detects_email_address(self, detector: DataSensitivityDetector) -> None:
+        result = detector.scan("Contact us at alice@example.com for support.")
         assert "customer_email" in result.detected_types
 
-    def test_scan_email_sets_level_two(self) -> None:
-        result = self.detector.scan("Email: bob@company.org")
+    def test_scan_email_sets_level_two(self, detector: DataSensitivityDetector) -> None:
+        result = detector.scan("Email: bob@company.org")
         assert result.max_level >= 2
 
-    def test_scan_detects_pci_card_number(self) -> None:
-        result = self.detector.scan("Card number: 4111111111111111")
+    def test_scan_detects_pci_card_number(self, detector: DataSensitivityDetector) -> None:
+        result = detector.scan("Card number: 4111111111111111")
         assert "pci_card_data" in result.detected_types
 
-    def test_scan_detects_cvv_keyword(self) -> None:
-        result = self.detector.scan("Enter your CVV to complete the transaction.")
+    @pytest.mark.parametrize(
+        "number",
+        ["4111111111111111", "5500000000000004", "378282246310005", "6011111111111117"],
+    )
+    def test_scan_luhn_valid_card_numbers_detected(
+        self, detector: DataSensitivityDetector, number: str
+    ) -> None:
+        assert detector.scan(f"ref {number}").detected_types == ["pci_card_data"]
+
+    def test_scan_luhn_invalid_card_number_ignored(
+        self, detector: DataSensitivityDetector
+    ) -> None:
+        assert detector.scan("order 4111111111111112 shipped").detected_types == []
+
+    def test_scan_card_evidence_counts_only_luhn_valid(
+        self, detector: DataSensitivityDetector
+    ) -> None:
+        result = detector.scan("4111111111111111 4111111111111112 5500000000000004")
+        assert result.evidence["pci_card_data"][0].endswith("matched 2 time(s)")
+
+    def test_scan_detects_cvv_keyword(self, detector: DataSensitivityDetector) -> None:
+        result = detector.scan("Enter your CVV to complete the transaction.")
         assert "pci_card_data" in result.detected_types
 
-    def test_scan_detects_medical_records(self) -> None:
-        result = self.detector.scan("Patient diagnosis: ICD-10 code J18.9")
+    def test_scan_detects_medical_records(self, detector: DataSensitivityDetector) -> None:
+        result = detector.scan("Patient diagnosis: ICD-10 code J18.9")
         assert "medical_records" in result.detected_types
 
-    def test_scan_detects_patient_id(self) -> None:
-        result = self.detector.scan("The patient record contains a patient ID.")
+    def test_scan_detects_patient_id(self, detector: DataSensitivityDetector) -> None:
+        result = detector.scan("The patient record contains a patient ID.")
         assert "medical_records" in result.detected_types
 
-    def test_scan_detects_phi_ssn_format(self) -> None:
-        result = self.detector.scan("SSN: 123-45-6789")
+    def test_scan_detects_phi_ssn_format(self, detector: DataSensitivityDetector) -> None:
+        result = detector.scan("SSN: 123-45-6789")
         assert "phi" in result.detected_types
 
-    def test_scan_detects_phi_keyword(self) -> None:
-        result = self.detector.scan("This document contains protected health information.")
+    def test_scan_detects_phi_keyword(self, detector: DataSensitivityDetector) -> None:
+        result = detector.scan("This document contains protected health information.")
         assert "phi" in result.detected_types
 
-    def test_scan_detects_biometric_data(self) -> None:
-        result = self.detector.scan("The system uses fingerprint recognition.")
+    def test_scan_detects_biometric_data(self, detector: DataSensitivityDetector) -> None:
+        result = detector.scan("The system uses fingerprint recognition.")
         assert "biometric_data" in result.detected_types
 
-    def test_scan_detects_genetic_data(self) -> None:
-        result = self.detector.scan("The genome sequence was analysed for SNP variants.")
+    def test_scan_detects_genetic_data(self, detector: DataSensitivityDetector) -> None:
+        result = detector.scan("The genome sequence was analysed for SNP variants.")
         assert "genetic_data" in result.detected_types
 
-    def test_scan_detects_classified_marker(self) -> None:
-        result = self.detector.scan("TOP SECRET document regarding national security.")
+    def test_scan_detects_classified_marker(self, detector: DataSensitivityDetector) -> None:
+        result = detector.scan("TOP SECRET document regarding national security.")
         assert "classified" in result.detected_types
         assert result.sovereignty_level == SovereigntyLevel.L7_AIRGAPPED
 
-    def test_scan_detects_itar(self) -> None:
-        result = self.detector.scan("This item is ITAR controlled under USML Category XV.")
+    def test_scan_detects_itar(self, detector: DataSensitivityDetector) -> None:
+        result = detector.scan("This item is ITAR controlled under USML Category XV.")
         assert "itar_technical_data" in result.detected_types
 
-    def test_scan_detects_financial_routing_number(self) -> None:
-        result = self.detector.scan("Routing number provided for wire transfer.")
+    def test_scan_detects_financial_routing_number(
+        self, detector: DataSensitivityDetector
+    ) -> None:
+        result = detector.scan("Routing number provided for wire transfer.")
         assert "financial_data" in result.detected_types
 
-    def test_scan_detected_types_are_sorted(self) -> None:
-        result = self.detector.scan(
+    def test_scan_detected_types_are_sorted(self, detector: DataSensitivityDetector) -> None:
+        result = detector.scan(
             "Email: test@test.com. Routing number for wire transfer."
         )
         assert result.detected_types == sorted(result.detected_types)
 
-    def test_scan_evidence_keys_match_detected_types(self) -> None:
-        result = self.detector.scan("Email: test@example.com for billing.")
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "TOP SECRET: SSN 123-45-6789, genome and cvv",
+            "TOP SECRET: SSN 123-45-6789, genome and cvv — naïve",
+        ],
+        ids=["ascii", "non-ascii"],
+    )
+    def test_scan_evidence_collected_in_sorted_order(
+        self, detector: DataSensitivityDetector, text: str
+    ) -> None:
+        result = detector.scan(text)
+        assert result.detected_types == ["classified", "genetic_data", "pci_card_data", "phi"]
+        assert list(result.evidence) == result.detected_types
+
+    def test_scan_evidence_keys_match_detected_types(
+        self, detector: DataSensitivityDetector
+    ) -> None:
+        result = detector.scan("Email: test@example.com for billing.")
         for data_type in result.detected_types:
             assert data_type in result.evidence
 
-    def test_scan_max_level_reflects_highest_type(self) -> None:
+    def test_scan_max_level_reflects_highest_type(self, detector: DataSensitivityDetector) -> None:
         # Classified = 7, should dominate
-        result = self.detector.scan(
+        result = detector.scan(
             "Email: a@b.com. TOP SECRET clearance required."
         )
         assert result.max_level == 7
 
-    def test_scan_phi_dominates_over_medical_records(self) -> None:
-        result = self.detector.scan(
+    def test_scan_detects_match_after_long_clean_prefix(
+        self, detector: DataSensitivityDetector
+    ) -> None:
+        text = "Routine status update with nothing notable. " * 50 + "SSN: 123-45-6789"
+        result = detector.scan(text)
+        assert result.detected_types == ["phi"]
+
+    def test_scan_mixed_case_keywords_detected(
+        self, detector: DataSensitivityDetector
+    ) -> None:
+        result = detector.scan("Top Secret memo: Patient Chart and Wire Transfer details")
+        assert result.detected_types == ["classified", "financial_data", "medical_records"]
+
+    def test_scan_non_ascii_text_still_detected(self, detector: DataSensitivityDetector) -> None:
+        result = detector.scan("Patiënt İD pending — TOP SECRET, SSN 123-45-6789")
+        assert "classified" in result.detected_types
+        assert "phi" in result.detected_types
+
+    def test_scan_evidence_counts_every_occurrence(
+        self, detector: DataSensitivityDetector
+    ) -> None:
+        result = detector.scan("a@b.com and c@d.org")
+        assert result.evidence["customer_email"][0].endswith("matched 2 time(s)")
+
+    def test_scan_phi_dominates_over_medical_records(
+        self, detector: DataSensitivityDetector
+    ) -> None:
+        result = detector.scan(
             "Patient record with date of birth and diagnosis."
         )
         # PHI scores 5, medical_records scores 4
         assert result.max_level >= 4
 
 
-class TestDataSensitivityDetectorScoreDataTypes:
-    def setup_method(self) -> None:
-        self.detector = DataSensitivityDetector()
+class TestDataSensitivityDetectorScanBytes:
+    @pytest.mark.parametrize(
+        "text",
+        ["SSN: 123-45-6789, top\x1csecret", "Patiënt İD — TOP SECRET", ""],
+        ids=["ascii", "non-ascii", "empty"],
+    )
+    def test_scan_bytes_matches_scan(self, detector: DataSensitivityDetector, text: str) -> None:
+        assert detector.scan_bytes(text.encode("utf-8")) == detector.scan(text)
+
+    def test_scan_bytes_replaces_invalid_utf8(self, detector: DataSensitivityDetector) -> None:
+        result = detector.scan_bytes(b"\xff\xfe TOP SECRET")
+        assert result.detected_types == ["classified"]
+
+
+class TestDataSensitivityDetectorHyperscan:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "The quick brown fox jumps over the lazy dog.",
+            "Email a@b.com and c@d.org, card 4111111111111111, SSN 123-45-6789",
+            "Top Secret memo: Patient Chart, wire transfer, CVV2 and cvv",
+            "top\x1csecret genome\x1fsequence",
+        ],
+        ids=["empty", "clean", "structured", "keywords", "ascii-separators"],
+    )
+    def test_hyperscan_matches_regex_path(
+        self, detector: DataSensitivityDetector, text: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pytest.importorskip("hyperscan")
+        monkeypatch.setattr(sensitivity_module, "_HAS_HYPERSCAN", True)
+        accelerated = detector.scan(text)
+        monkeypatch.setattr(sensitivity_module, "_HAS_HYPERSCAN", False)
+        assert accelerated == detector.scan(text)
+
+    def test_ascii_separators_count_as_whitespace(
+        self, detector: DataSensitivityDetector
+    ) -> None:
+        result = detector.scan("top\x1csecret")
+        assert result.detected_types == ["classified"]
+
+
+class TestScoreToLevel:
+    @pytest.mark.parametrize(
+        ("score", "expected"),
+        [
+            (-3, SovereigntyLevel.L1_CLOUD),
+            (1, SovereigntyLevel.L1_CLOUD),
+            (4, SovereigntyLevel.L4_LOCAL_AUGMENTED),
+            (7, SovereigntyLevel.L7_AIRGAPPED),
+            (12, SovereigntyLevel.L7_AIRGAPPED),
+        ],
+    )
+    def test_score_is_clamped_and_mapped(self, score: int, expected: SovereigntyLevel) -> None:
+        assert sensitivity_module._score_to_level(score) is expected
+
+    def test_custom_score_above_seven_caps_level(self) -> None:
+        detector = DataSensitivityDetector(custom_scores={"classified": 9})
+        result = detector.scan("TOP SECRET")
+        assert result.max_level == 9
+        assert result.sovereignty_level == SovereigntyLevel.L7_AIRGAPPED
 
-    def test_empty_list_returns_one(self) -> None:
-        assert self.detector.score_data_types([]) == 1
 
-    def test_single_known_type_returns_its_score(self) -> None:
-        assert self.detector.score_data_types(["medical_records"]) == 4
+class TestDataSensitivityDetectorScoreDataTypes:
+    def test_empty_list_returns_one(self, detector: DataSensitivityDetector) -> None:
+        assert detector.score_data_types([]) == 1
+
+    def test_single_known_type_returns_its_score(self, detector: DataSensitivityDetector) -> None:
+        assert detector.score_data_types(["medical_records"]) == 4
 
-    def test_multiple_types_returns_max(self) -> None:
-        score = self.detector.score_data_types(["employee_data", "phi"])
+    def test_multiple_types_returns_max(self, detector: DataSensitivityDetector) -> None:
+        score = detector.score_data_types(["employee_data", "phi"])
         assert score == 5  # phi=5 > employee_data=2
 
-    def test_unknown_type_defaults_to_one(self) -> None:
-        assert self.detector.score_data_types(["nonexistent_type"]) == 1
+    def test_unknown_type_defaults_to_one(self, detector: DataSensitivityDetector) -> None:
+        assert detector.score_data_types(["nonexistent_type"]) == 1
 
-    def test_classified_returns_seven(self) -> None:
-        assert self.detector.score_data_types(["classified"]) == 7
+    def test_classified_returns_seven(self, detector: DataSensitivityDetector) -> None:
+        assert detector.score_data_types(["classified"]) == 7
 
 
 class TestDataSensitivityDetectorCustomisation:
+    def test_instances_hold_only_the_custom_delta(self) -> None:
+        # Built-in patterns and the prefilter are module state compiled once;
+        # constructing a detector must not copy or recompile them.
+        custom = re.compile(r"\bPROPRIETARY\b")
+        detector = DataSensitivityDetector(custom_patterns={"financial_data": [custom]})
+        assert detector._custom_patterns == {"financial_data": (custom,)}
+        assert DataSensitivityDetector()._custom_patterns == {}
+
+    def test_custom_patterns_are_stored_by_identity(self) -> None:
+        custom = re.compile(r"\bPROPRIETARY\b")
+        detector = DataSensitivityDetector(custom_patterns={"financial_data": [custom]})
+        assert detector._custom_patterns["financial_data"][-1] is custom
+
+    def test_uncompiled_custom_pattern_raises_type_error(self) -> None:
+        patterns = {"financial_data": [r"\bPROPRIETARY\b"]}
+        with pytest.raises(TypeError, match="financial_data"):
+            DataSensitivityDetector(custom_patterns=patterns)  # type: ignore[arg-type]
+
     def test_custom_score_overrides_builtin(self) -> None:
         detector = DataSensitivityDetector(custom_scores={"phi": 6})
         assert detector.score_data_types(["phi"]) == 6
 
     def test_custom_pattern_is_detected(self) -> None:
-        import re
-
         custom_patterns = {"financial_data": [re.compile(r"\bPROPRIETARY\b")]}
         detector = DataSensitivityDetector(custom_patterns=custom_patterns)
         result = detector.scan("This is PROPRIETARY corporate information.")
         assert "financial_data" in result.detected_types
 
-    def test_custom_new_data_type_with_score(self) -> None:
-        import re
+    def test_custom_pattern_runs_on_short_text(self) -> None:
+        detector = DataSensitivityDetector(custom_patterns={"tag": [re.compile("X")]})
+        assert detector.scan("X").detected_types == ["tag"]
 
+    def test_custom_new_data_type_with_score(self) -> None:
         custom_patterns = {"trade_secret": [re.compile(r"\bTRADE_SECRET\b")]}
         custom_scores = {"trade_secret": 6}
         detector = DataSensitivityDetector(
@@ -186,3 +436,22 @@ class TestDataSensitivityDetectorCustomisation:
         result = detector.scan("Document contains TRADE_SECRET information.")
         assert "trade_secret" in result.detected_types
         assert result.max_level == 6
+
+    def test_custom_pattern_identical_to_builtin_runs_unvalidated(self) -> None:
+        # re.compile caches, so this is the very object the built-in card
+        # type uses; the Luhn filter must still not apply to the custom type.
+        custom = re.compile(sensitivity_module._CARD_NUMBER_PATTERN.pattern)
+        assert custom is sensitivity_module._CARD_NUMBER_PATTERN
+        detector = DataSensitivityDetector(
+            custom_patterns={"card_like": [custom]}, custom_scores={"card_like": 3}
+        )
+        result = detector.scan("4111111111111112")
+        assert result.detected_types == ["card_like"]
+        assert result.evidence["card_like"][0].endswith("matched 1 time(s)")
+
+    def test_custom_types_are_sorted_with_builtins(self) -> None:
+        detector = DataSensitivityDetector(
+            custom_patterns={"aaa_custom": [re.compile("zzz")], "zzz_custom": [re.compile("aaa")]}
+        )
+        result = detector.scan("aaa zzz TOP SECRET")
+        assert result.detected_types == ["aaa_custom", "classified", "zzz_custom"]
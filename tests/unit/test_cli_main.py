@@ -1,30 +1,134 @@
 """Tests for CLI commands in agent_sovereign.cli.main.
 
 Uses Click's CliRunner for full in-process invocation so that coverage
-is collected against the real command implementations.
+is collected against the real command implementations. For quick local
+iterations the module is marked ``cli_fast``; run it without coverage with::
+
+    pytest -m cli_fast --no-cov -p no:cacheprovider tests/unit/test_cli_main.py
 """
 from __future__ import annotations
 
 import json
+import re
 import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import pytest
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
+from rich.highlighter import NullHighlighter
+
+from agent_sovereign.classifier.assessor import SovereigntyAssessor
+from agent_sovereign.cli import main as cli_main
+from agent_sovereign.cli.main import _assessment_summary, cli
+from agent_sovereign.edge.runtime import EdgeRuntime
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    JsonInvoke = Callable[[tuple[str, ...]], tuple[Result, Any]]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the optional extra
+    orjson = None  # type: ignore[assignment]
 
-from agent_sovereign.cli.main import cli
+pytestmark = pytest.mark.cli_fast
 
 
 # ---------------------------------------------------------------------------
-# Shared fixture
+# Shared fixture and helpers
 # ---------------------------------------------------------------------------
 
-
-@pytest.fixture()
+# Output checks compiled once; the case-insensitive ones replace lower()-ing each output.
+_DIGIT_RE = re.compile(r"\d")
+_PLUGIN_RE = re.compile("plugin", re.IGNORECASE)
+_SOVEREIGNTY_RE = re.compile("sovereignty", re.IGNORECASE)
+_MUTUALLY_EXCLUSIVE_RE = re.compile("mutually exclusive", re.IGNORECASE)
+_NONE_RE = re.compile("none", re.IGNORECASE)
+_ISSUES_OR_FAILED_RE = re.compile("Issues|(?i:failed)")
+_WARNING_RE = re.compile("warning", re.IGNORECASE)
+
+# Fields each --json-output payload must carry, checked with one subset test.
+_ASSESS_KEYS = frozenset({"level", "score", "justification"})
+_PACKAGE_KEYS = frozenset({"package_id", "sovereignty_level", "file_count", "checksum"})
+_VALIDATION_CHECK_KEYS = frozenset({"check_id", "status", "message"})
+_ATTESTATION_KEYS = frozenset({"attestation_id", "signature", "algorithm"})
+_COMPLIANCE_KEYS = frozenset(
+    {
+        "deployment_id",
+        "overall_status",
+        "issues",
+        "passed_checks",
+        "failed_checks",
+        "jurisdiction_summary",
+    }
+)
+_COMPLIANCE_ISSUE_KEYS = frozenset({"issue_id", "severity", "description", "remediation"})
+_EDGE_CONFIG_KEYS = frozenset({"validation", "performance_estimate"})
+_PERFORMANCE_ESTIMATE_KEYS = frozenset(
+    {
+        "tokens_per_second",
+        "time_to_first_token_ms",
+        "max_context_tokens",
+        "quantization_speedup_factor",
+        "notes",
+    }
+)
+
+# Level-1 controls that pass both validate and compliance; callers add --region.
+_L1_BASIC_CONTROLS = (
+    "--level", "1",
+    "--encryption-at-rest", "AES-256",
+    "--encryption-in-transit", "TLS-1.3",
+    "--key-management", "provider_managed",
+    "--audit-logging",
+)
+
+
+@pytest.fixture(scope="session")
 def runner() -> CliRunner:
+    # CliRunner keeps no state between invoke() calls, so one instance serves
+    # every test; a test needing different runner settings builds its own.
     return CliRunner()
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _plain_console() -> Iterator[None]:
+    # CliRunner output is not a terminal, so Rich emits no colour codes anyway;
+    # swapping out the repr highlighter skips its regex pass over every printed
+    # string without changing the captured text.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cli_main.console, "highlighter", NullHighlighter())
+        yield
+
+
+def _parse_json(output: str) -> Any:
+    """Parse captured ``--json-output`` text, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(output)
+    return json.loads(output)
+
+
+@pytest.fixture(scope="module")
+def json_invoke(runner: CliRunner) -> JsonInvoke:
+    """Return a function running ``cli *args --json-output`` once per distinct argv.
+
+    The (result, parsed JSON) pair is cached for the module, so tests that
+    assert different keys of the same command output share one invocation.
+    Callers must treat the returned data as read-only.
+    """
+    cache: dict[tuple[str, ...], tuple[Result, Any]] = {}
+
+    def invoke(args: tuple[str, ...]) -> tuple[Result, Any]:
+        if args not in cache:
+            result = runner.invoke(cli, [*args, "--json-output"])
+            cache[args] = (result, _parse_json(result.output))
+        return cache[args]
+
+    return invoke
+
+
 # ---------------------------------------------------------------------------
 # version command
 # ---------------------------------------------------------------------------
@@ -40,7 +144,7 @@ class TestVersionCommand:
         result = runner.invoke(cli, ["version"])
         assert result.exit_code == 0
         # Should contain at least a digit (version number)
-        assert any(ch.isdigit() for ch in result.output)
+        assert _DIGIT_RE.search(result.output)
 
 
 # ---------------------------------------------------------------------------
@@ -55,7 +159,7 @@ class TestPluginsCommand:
 
     def test_plugins_mentions_plugins(self, runner: CliRunner) -> None:
         result = runner.invoke(cli, ["plugins"])
-        assert "plugin" in result.output.lower()
+        assert _PLUGIN_RE.search(result.output)
 
 
 # ---------------------------------------------------------------------------
@@ -63,6 +167,11 @@ class TestPluginsCommand:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def assessor() -> SovereigntyAssessor:
+    return SovereigntyAssessor()
+
+
 class TestAssessCommand:
     def test_basic_assess_exits_zero(self, runner: CliRunner) -> None:
         result = runner.invoke(cli, ["assess", "--data-types", "phi"])
@@ -79,43 +188,24 @@ class TestAssessCommand:
             ],
         )
         assert result.exit_code == 0
-        assert "Sovereignty" in result.output or "sovereignty" in result.output.lower()
+        assert _SOVEREIGNTY_RE.search(result.output)
 
-    def test_assess_json_output_is_valid_json(self, runner: CliRunner) -> None:
-        result = runner.invoke(
-            cli,
-            ["assess", "--data-types", "phi", "--json-output"],
-        )
-        assert result.exit_code == 0
+    def test_assess_json_output_is_valid_json(self, json_invoke: JsonInvoke) -> None:
         # Output should contain parseable JSON
-        data = json.loads(result.output)
-        assert "level" in data
-        assert "score" in data
-        assert "justification" in data
-
-    def test_assess_json_output_has_regulatory_drivers(self, runner: CliRunner) -> None:
-        result = runner.invoke(
-            cli,
-            [
-                "assess",
-                "--data-types", "phi",
-                "--regulations", "HIPAA",
-                "--json-output",
-            ],
-        )
+        result, data = json_invoke(("assess", "--data-types", "phi", "--regulations", "HIPAA"))
         assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert "regulatory_drivers" in data
+        assert data.keys() >= _ASSESS_KEYS
 
-    def test_assess_json_output_has_warnings_key(self, runner: CliRunner) -> None:
-        result = runner.invoke(
-            cli,
-            ["assess", "--data-types", "financial_data", "--json-output"],
-        )
-        assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert "warnings" in data
-        assert "capability_requirements" in data
+    def test_assess_summary_has_regulatory_drivers(self, assessor: SovereigntyAssessor) -> None:
+        # The JSON fields are checked on the summary directly; the test above
+        # covers the same dict going through Click and --json-output.
+        summary = _assessment_summary(assessor.assess(["phi"], ["HIPAA"]))
+        assert summary["regulatory_drivers"] == {"HIPAA": "L3_HYBRID"}
+
+    def test_assess_summary_has_warnings_key(self, assessor: SovereigntyAssessor) -> None:
+        summary = _assessment_summary(assessor.assess(["financial_data"], []))
+        assert "warnings" in summary
+        assert "capability_requirements" in summary
 
     def test_assess_no_options_uses_defaults(self, runner: CliRunner) -> None:
         result = runner.invoke(cli, ["assess"])
@@ -167,6 +257,15 @@ class TestAssessCommand:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def package_source_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # package only reads its source directory, so one model file serves every
+    # test; tests that write a manifest send it to their own tmp_path.
+    source_dir = tmp_path_factory.mktemp("pkg_src")
+    (source_dir / "model.bin").write_bytes(b"fake model weights")
+    return source_dir
+
+
 class TestPackageCommand:
     def test_package_no_source_or_files_exits_nonzero(self, runner: CliRunner) -> None:
         result = runner.invoke(cli, ["package", "--level", "1"])
@@ -174,51 +273,60 @@ class TestPackageCommand:
         assert "Error" in result.output
 
     def test_package_source_dir_and_files_mutually_exclusive(
-        self, runner: CliRunner, tmp_path: Path
+        self, runner: CliRunner, package_source_dir: Path
     ) -> None:
-        dummy_file = tmp_path / "model.bin"
-        dummy_file.write_bytes(b"data")
         result = runner.invoke(
             cli,
             [
                 "package",
                 "--level", "1",
-                "--source-dir", str(tmp_path),
-                "--files", str(dummy_file),
+                "--source-dir", str(package_source_dir),
+                "--files", str(package_source_dir / "model.bin"),
             ],
         )
         assert result.exit_code != 0
-        assert "mutually exclusive" in result.output.lower()
+        assert _MUTUALLY_EXCLUSIVE_RE.search(result.output)
 
-    def test_package_with_source_dir_exits_zero(
-        self, runner: CliRunner, tmp_path: Path
+    @pytest.mark.parametrize(
+        ("level", "extra_args", "expected"),
+        [
+            ("1", (), "L1"),
+            ("3", ("--package-id", "my-custom-pkg-001"), "my-custom-pkg-001"),
+            # Rich output should mention the sovereignty level
+            ("2", (), "L2"),
+        ],
+        ids=["source-dir", "custom-package-id", "rich-level"],
+    )
+    def test_package_with_source_dir(
+        self,
+        runner: CliRunner,
+        package_source_dir: Path,
+        level: str,
+        extra_args: tuple[str, ...],
+        expected: str,
     ) -> None:
-        (tmp_path / "model.bin").write_bytes(b"fake model weights")
         result = runner.invoke(
             cli,
-            ["package", "--level", "1", "--source-dir", str(tmp_path)],
+            ["package", "--level", level, "--source-dir", str(package_source_dir), *extra_args],
         )
         assert result.exit_code == 0
+        assert expected in result.output
 
     def test_package_json_output(
-        self, runner: CliRunner, tmp_path: Path
+        self, runner: CliRunner, package_source_dir: Path
     ) -> None:
-        (tmp_path / "model.bin").write_bytes(b"fake model weights")
         result = runner.invoke(
             cli,
             [
                 "package",
                 "--level", "1",
-                "--source-dir", str(tmp_path),
+                "--source-dir", str(package_source_dir),
                 "--json-output",
             ],
         )
         assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert "package_id" in data
-        assert "sovereignty_level" in data
-        assert "file_count" in data
-        assert "checksum" in data
+        data = _parse_json(result.output)
+        assert data.keys() >= _PACKAGE_KEYS
 
     def test_package_with_explicit_files(
         self, runner: CliRunner, tmp_path: Path
@@ -232,16 +340,15 @@ class TestPackageCommand:
         assert result.exit_code == 0
 
     def test_package_with_output_file(
-        self, runner: CliRunner, tmp_path: Path
+        self, runner: CliRunner, package_source_dir: Path, tmp_path: Path
     ) -> None:
-        (tmp_path / "model.bin").write_bytes(b"data")
         manifest_path = tmp_path / "manifest.yaml"
         result = runner.invoke(
             cli,
             [
                 "package",
                 "--level", "1",
-                "--source-dir", str(tmp_path),
+                "--source-dir", str(package_source_dir),
                 "--output", str(manifest_path),
             ],
         )
@@ -249,73 +356,37 @@ class TestPackageCommand:
         assert manifest_path.exists()
         assert "Manifest written" in result.output
 
-    def test_package_with_custom_package_id(
-        self, runner: CliRunner, tmp_path: Path
-    ) -> None:
-        (tmp_path / "model.bin").write_bytes(b"data")
-        result = runner.invoke(
-            cli,
-            [
-                "package",
-                "--level", "3",
-                "--source-dir", str(tmp_path),
-                "--package-id", "my-custom-pkg-001",
-            ],
-        )
-        assert result.exit_code == 0
-        assert "my-custom-pkg-001" in result.output
-
-    def test_package_rich_output_shows_level_and_template(
-        self, runner: CliRunner, tmp_path: Path
-    ) -> None:
-        (tmp_path / "agent.py").write_text("print('hello')")
-        result = runner.invoke(
-            cli,
-            ["package", "--level", "2", "--source-dir", str(tmp_path)],
-        )
-        assert result.exit_code == 0
-        # Rich output should mention sovereignty level and template
-        assert "L2" in result.output or "l2" in result.output.lower() or "CLOUD" in result.output
-
 
 # ---------------------------------------------------------------------------
 # validate command
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def l1_basic_validate_result(runner: CliRunner) -> Result:
+    """Invoke ``validate`` once with the basic L1 controls (rich output)."""
+    return runner.invoke(cli, ["validate", *_L1_BASIC_CONTROLS, "--region", "US"])
+
+
+@pytest.fixture(scope="module")
+def l1_basic_validate_json_result(runner: CliRunner) -> Result:
+    """Invoke ``validate`` once with the basic L1 controls and ``--json-output``."""
+    return runner.invoke(
+        cli, ["validate", *_L1_BASIC_CONTROLS, "--region", "US", "--json-output"]
+    )
+
+
 class TestValidateCommand:
-    def test_validate_l1_basic_passes(self, runner: CliRunner) -> None:
-        result = runner.invoke(
-            cli,
-            [
-                "validate",
-                "--level", "1",
-                "--region", "US",
-                "--encryption-at-rest", "AES-256",
-                "--encryption-in-transit", "TLS-1.3",
-                "--key-management", "provider_managed",
-                "--audit-logging",
-            ],
-        )
+    def test_validate_l1_basic_passes(self, l1_basic_validate_result: Result) -> None:
+        result = l1_basic_validate_result
         # L1 basic config should pass validation
         assert result.exit_code == 0
         assert "PASSED" in result.output
 
-    def test_validate_json_output_overall_passed(self, runner: CliRunner) -> None:
-        result = runner.invoke(
-            cli,
-            [
-                "validate",
-                "--level", "1",
-                "--region", "US",
-                "--encryption-at-rest", "AES-256",
-                "--encryption-in-transit", "TLS-1.3",
-                "--key-management", "provider_managed",
-                "--audit-logging",
-                "--json-output",
-            ],
-        )
-        data = json.loads(result.output)
+    def test_validate_json_output_overall_passed(
+        self, l1_basic_validate_json_result: Result
+    ) -> None:
+        data = _parse_json(l1_basic_validate_json_result.output)
         assert "overall" in data
         assert "checks" in data
 
@@ -332,95 +403,63 @@ class TestValidateCommand:
                 "--json-output",
             ],
         )
-        data = json.loads(result.output)
+        data = _parse_json(result.output)
         assert data["overall"] == "FAILED"
         assert result.exit_code == 1
 
-    def test_validate_failed_rich_output_shows_failed_count(
-        self, runner: CliRunner
-    ) -> None:
-        result = runner.invoke(
-            cli,
-            ["validate", "--level", "4"],
-        )
-        assert result.exit_code == 1
-        assert "FAILED" in result.output
-
-    def test_validate_with_all_flags(self, runner: CliRunner) -> None:
-        result = runner.invoke(
-            cli,
-            [
-                "validate",
-                "--level", "4",
-                "--region", "US",
-                "--network-isolated",
-                "--encryption-at-rest", "FIPS-140-2-L2",
-                "--encryption-in-transit", "mTLS",
-                "--key-management", "local_hsm",
-                "--audit-logging",
-                "--air-gapped",
-                "--tpm",
-                "--fips-hardware",
-            ],
-        )
-        # All controls present for L4 — should pass
-        assert result.exit_code == 0
-
-    def test_validate_rich_output_skipped_status(self, runner: CliRunner) -> None:
-        # L1 with minimal config will have some SKIPPED checks (e.g. air_gap not required)
-        result = runner.invoke(
-            cli,
-            [
-                "validate",
-                "--level", "1",
-                "--region", "US",
-                "--encryption-at-rest", "AES-256",
-                "--encryption-in-transit", "TLS-1.3",
-                "--key-management", "provider_managed",
-                "--audit-logging",
-            ],
-        )
-        assert result.exit_code == 0
-
-    def test_validate_warning_status_shown(self, runner: CliRunner) -> None:
-        # Some checks may produce WARNING status
-        result = runner.invoke(
-            cli,
-            [
-                "validate",
-                "--level", "2",
-                "--region", "US",
-                "--encryption-at-rest", "AES-256-CMK",
-                "--encryption-in-transit", "TLS 1.3",
-                "--key-management", "customer_managed_kms",
-                "--audit-logging",
-            ],
-        )
-        # Just confirm it runs cleanly
-        assert result.exit_code in (0, 1)
+    @pytest.mark.parametrize(
+        ("args", "expect_exit", "expect_substr"),
+        [
+            (("--level", "4"), 1, "Validation FAILED"),
+            # All controls present for L4 — should pass
+            (
+                (
+                    "--level", "4",
+                    "--region", "US",
+                    "--network-isolated",
+                    "--encryption-at-rest", "FIPS-140-2-L2",
+                    "--encryption-in-transit", "mTLS",
+                    "--key-management", "local_hsm",
+                    "--audit-logging",
+                    "--air-gapped",
+                    "--tpm",
+                    "--fips-hardware",
+                ),
+                0,
+                "All checks PASSED",
+            ),
+            (
+                (
+                    "--level", "2",
+                    "--region", "US",
+                    "--encryption-at-rest", "AES-256-CMK",
+                    "--encryption-in-transit", "TLS 1.3",
+                    "--key-management", "customer_managed_kms",
+                    "--audit-logging",
+                ),
+                0,
+                "All checks PASSED",
+            ),
+        ],
+        ids=["l4-no-controls-fails", "l4-all-controls-passes", "l2-customer-kms-passes"],
+    )
+    def test_validate_matrix(
+        self,
+        runner: CliRunner,
+        args: tuple[str, ...],
+        expect_exit: int,
+        expect_substr: str,
+    ) -> None:
+        result = runner.invoke(cli, ["validate", *args])
+        assert result.exit_code == expect_exit
+        assert expect_substr in result.output
 
     def test_validate_json_checks_have_required_fields(
-        self, runner: CliRunner
+        self, l1_basic_validate_json_result: Result
     ) -> None:
-        result = runner.invoke(
-            cli,
-            [
-                "validate",
-                "--level", "1",
-                "--region", "US",
-                "--encryption-at-rest", "AES-256",
-                "--encryption-in-transit", "TLS-1.3",
-                "--key-management", "provider_managed",
-                "--audit-logging",
-                "--json-output",
-            ],
-        )
-        data = json.loads(result.output)
+        data = _parse_json(l1_basic_validate_json_result.output)
         assert len(data["checks"]) > 0
-        first_check = data["checks"][0]
-        assert "check_id" in first_check
-        assert "status" in first_check
-        assert "message" in first_check
+        assert data["checks"][0].keys() >= _VALIDATION_CHECK_KEYS
 
 
 # ---------------------------------------------------------------------------
@@ -437,19 +476,16 @@ class TestProvenanceCommand:
         assert result.exit_code == 0
         assert "test-model-v1" in result.output
 
-    def test_provenance_json_output(self, runner: CliRunner) -> None:
-        result = runner.invoke(
-            cli,
-            [
+    def test_provenance_json_output(self, json_invoke: JsonInvoke) -> None:
+        result, data = json_invoke(
+            (
                 "provenance",
                 "--model-id", "llama-3-8b",
                 "--source", "hf://meta/llama3",
                 "--version", "1.0.0",
-                "--json-output",
-            ],
+            )
         )
         assert result.exit_code == 0
-        data = json.loads(result.output)
         assert data["model_id"] == "llama-3-8b"
         assert data["source"] == "hf://meta/llama3"
         assert data["version"] == "1.0.0"
@@ -469,23 +505,17 @@ class TestProvenanceCommand:
         )
         assert result.exit_code == 0
 
-    def test_provenance_json_includes_training_data_list(
-        self, runner: CliRunner
-    ) -> None:
-        result = runner.invoke(
-            cli,
-            [
+    def test_provenance_json_includes_training_data_list(self, json_invoke: JsonInvoke) -> None:
+        result, data = json_invoke(
+            (
                 "provenance",
                 "--model-id", "my-model",
                 "--training-data", "DatasetA",
                 "--training-data", "DatasetB",
-                "--json-output",
-            ],
+            )
         )
         assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert "DatasetA" in data["training_data_sources"]
-        assert "DatasetB" in data["training_data_sources"]
+        assert {"DatasetA", "DatasetB"} <= set(data["training_data_sources"])
 
     def test_provenance_with_parent_model_id(self, runner: CliRunner) -> None:
         result = runner.invoke(
@@ -499,20 +529,15 @@ class TestProvenanceCommand:
         assert result.exit_code == 0
         assert "llama-3-8b" in result.output
 
-    def test_provenance_json_with_parent_model_id(
-        self, runner: CliRunner
-    ) -> None:
-        result = runner.invoke(
-            cli,
-            [
+    def test_provenance_json_with_parent_model_id(self, json_invoke: JsonInvoke) -> None:
+        result, data = json_invoke(
+            (
                 "provenance",
                 "--model-id", "my-finetune",
                 "--parent-model-id", "base-model",
-                "--json-output",
-            ],
+            )
         )
         assert result.exit_code == 0
-        data = json.loads(result.output)
         assert data["parent_model_id"] == "base-model"
 
     def test_provenance_with_attest_flag_adds_attestation(
@@ -530,24 +555,18 @@ class TestProvenanceCommand:
         assert "Attestation" in result.output
 
     def test_provenance_json_with_attest_includes_attestation_block(
-        self, runner: CliRunner
+        self, json_invoke: JsonInvoke
     ) -> None:
-        result = runner.invoke(
-            cli,
-            [
+        result, data = json_invoke(
+            (
                 "provenance",
                 "--model-id", "attested-model",
                 "--source", "internal",
                 "--attest",
-                "--json-output",
-            ],
+            )
         )
         assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert "attestation" in data
-        assert "attestation_id" in data["attestation"]
-        assert "signature" in data["attestation"]
-        assert "algorithm" in data["attestation"]
+        assert data["attestation"].keys() >= _ATTESTATION_KEYS
 
     def test_provenance_rich_output_shows_source_and_recorded_at(
         self, runner: CliRunner
@@ -572,7 +591,7 @@ class TestProvenanceCommand:
             ["provenance", "--model-id", "bare-model"],
         )
         assert result.exit_code == 0
-        assert "none" in result.output.lower()
+        assert _NONE_RE.search(result.output)
 
 
 # ---------------------------------------------------------------------------
@@ -580,44 +599,28 @@ class TestProvenanceCommand:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def l1_basic_compliance_result(runner: CliRunner) -> Result:
+    """Invoke ``compliance`` once with the basic L1 controls (rich output)."""
+    return runner.invoke(cli, ["compliance", *_L1_BASIC_CONTROLS, "--region", "US"])
+
+
+@pytest.fixture(scope="module")
+def l1_basic_compliance_json_result(runner: CliRunner) -> Result:
+    """Invoke ``compliance`` once with the basic L1 controls and ``--json-output``."""
+    return runner.invoke(
+        cli, ["compliance", *_L1_BASIC_CONTROLS, "--region", "US", "--json-output"]
+    )
+
+
 class TestComplianceCommand:
-    def test_compliance_l1_basic_exits_zero(self, runner: CliRunner) -> None:
-        result = runner.invoke(
-            cli,
-            [
-                "compliance",
-                "--level", "1",
-                "--region", "US",
-                "--encryption-at-rest", "AES-256",
-                "--encryption-in-transit", "TLS-1.3",
-                "--key-management", "provider_managed",
-                "--audit-logging",
-            ],
-        )
+    def test_compliance_l1_basic_exits_zero(self, l1_basic_compliance_result: Result) -> None:
         # L1 basic config should be compliant
-        assert result.exit_code == 0
+        assert l1_basic_compliance_result.exit_code == 0
 
-    def test_compliance_json_output_shape(self, runner: CliRunner) -> None:
-        result = runner.invoke(
-            cli,
-            [
-                "compliance",
-                "--level", "1",
-                "--region", "US",
-                "--encryption-at-rest", "AES-256",
-                "--encryption-in-transit", "TLS-1.3",
-                "--key-management", "provider_managed",
-                "--audit-logging",
-                "--json-output",
-            ],
-        )
-        data = json.loads(result.output)
-        assert "deployment_id" in data
-        assert "overall_status" in data
-        assert "issues" in data
-        assert "passed_checks" in data
-        assert "failed_checks" in data
-        assert "jurisdiction_summary" in data
+    def test_compliance_json_output_shape(self, l1_basic_compliance_json_result: Result) -> None:
+        data = _parse_json(l1_basic_compliance_json_result.output)
+        assert data.keys() >= _COMPLIANCE_KEYS
 
     def test_compliance_non_compliant_exits_nonzero(
         self, runner: CliRunner
@@ -641,7 +644,7 @@ class TestComplianceCommand:
                 "--json-output",
             ],
         )
-        data = json.loads(result.output)
+        data = _parse_json(result.output)
         assert data["overall_status"] != "compliant"
         assert result.exit_code == 1
 
@@ -652,12 +655,8 @@ class TestComplianceCommand:
             cli,
             [
                 "compliance",
-                "--level", "1",
+                *_L1_BASIC_CONTROLS,
                 "--region", "US",
-                "--encryption-at-rest", "AES-256",
-                "--encryption-in-transit", "TLS-1.3",
-                "--key-management", "provider_managed",
-                "--audit-logging",
                 "--policy-allowed-regions", "US",
             ],
         )
@@ -671,45 +670,25 @@ class TestComplianceCommand:
             cli,
             [
                 "compliance",
-                "--level", "1",
+                *_L1_BASIC_CONTROLS,
                 "--region", "CN",
-                "--encryption-at-rest", "AES-256",
-                "--encryption-in-transit", "TLS-1.3",
-                "--key-management", "provider_managed",
-                "--audit-logging",
                 "--policy-blocked-regions", "CN",
             ],
         )
         assert result.exit_code == 1
 
     def test_compliance_rich_output_shows_assessed_at(
-        self, runner: CliRunner
+        self, l1_basic_compliance_result: Result
     ) -> None:
-        result = runner.invoke(
-            cli,
-            [
-                "compliance",
-                "--level", "1",
-                "--region", "US",
-                "--encryption-at-rest", "AES-256",
-                "--encryption-in-transit", "TLS-1.3",
-                "--key-management", "provider_managed",
-                "--audit-logging",
-            ],
-        )
-        assert "Assessed at" in result.output
+        assert "Assessed at" in l1_basic_compliance_result.output
 
     def test_compliance_with_deployment_id(self, runner: CliRunner) -> None:
         result = runner.invoke(
             cli,
             [
                 "compliance",
-                "--level", "1",
+                *_L1_BASIC_CONTROLS,
                 "--region", "US",
-                "--encryption-at-rest", "AES-256",
-                "--encryption-in-transit", "TLS-1.3",
-                "--key-management", "provider_managed",
-                "--audit-logging",
                 "--deployment-id", "prod-cluster-01",
             ],
         )
@@ -726,7 +705,7 @@ class TestComplianceCommand:
         )
         # Should show Issues section or at least mention failures
         assert result.exit_code == 1
-        assert "Issues" in result.output or "FAILED" in result.output or "failed" in result.output.lower()
+        assert _ISSUES_OR_FAILED_RE.search(result.output)
 
     def test_compliance_warnings_displayed_when_present(
         self, runner: CliRunner
@@ -736,16 +715,12 @@ class TestComplianceCommand:
             cli,
             [
                 "compliance",
-                "--level", "1",
+                *_L1_BASIC_CONTROLS,
                 "--region", "UNKNOWNXYZ",
-                "--encryption-at-rest", "AES-256",
-                "--encryption-in-transit", "TLS-1.3",
-                "--key-management", "provider_managed",
-                "--audit-logging",
             ],
         )
         # Warnings should be displayed
-        assert "Warnings" in result.output or "warning" in result.output.lower() or result.exit_code in (0, 1)
+        assert _WARNING_RE.search(result.output)
 
     def test_compliance_jurisdiction_summary_shown_for_known_region(
         self, runner: CliRunner
@@ -778,13 +753,9 @@ class TestComplianceCommand:
                 "--json-output",
             ],
         )
-        data = json.loads(result.output)
+        data = _parse_json(result.output)
         if data["issues"]:
-            first_issue = data["issues"][0]
-            assert "issue_id" in first_issue
-            assert "severity" in first_issue
-            assert "description" in first_issue
-            assert "remediation" in first_issue
+            assert data["issues"][0].keys() >= _COMPLIANCE_ISSUE_KEYS
 
 
 # ---------------------------------------------------------------------------
@@ -792,163 +763,117 @@ class TestComplianceCommand:
 # ---------------------------------------------------------------------------
 
 
-class TestEdgeConfigCommand:
-    def test_edge_config_basic_exits_zero(self, runner: CliRunner) -> None:
-        result = runner.invoke(
-            cli,
-            ["edge-config", "--max-memory-mb", "8192"],
-        )
-        # Should exit 0 when valid resources
-        assert result.exit_code in (0, 1)  # depends on actual system memory
+# Far above every --max-memory-mb the passing cases request and far below the
+# 999999999 MiB the failing cases do, so exit codes do not depend on the host.
+_FIXED_AVAILABLE_MEMORY_MB = 32768
 
-    def test_edge_config_json_output_shape(self, runner: CliRunner) -> None:
-        result = runner.invoke(
-            cli,
-            [
-                "edge-config",
-                "--max-memory-mb", "512",
-                "--json-output",
-            ],
+
+@pytest.fixture(scope="class")
+def _fixed_available_memory() -> Iterator[None]:
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            EdgeRuntime,
+            "_detect_available_memory_mb",
+            staticmethod(lambda: _FIXED_AVAILABLE_MEMORY_MB),
         )
-        data = json.loads(result.output)
-        assert "validation" in data
-        assert "performance_estimate" in data
+        yield
+
+
+@pytest.mark.usefixtures("_fixed_available_memory")
+class TestEdgeConfigCommand:
+    @pytest.mark.parametrize(
+        ("args", "expect_exit", "expect_substr"),
+        [
+            (("--max-memory-mb", "8192"), 0, "Resource validation: VALID"),
+            (("--max-memory-mb", "4096"), 0, "Config memory     : 4096 MiB"),
+            (
+                ("--max-memory-mb", "4096", "--model-size-b", "7.0"),
+                0,
+                "Performance Estimate",
+            ),
+            (("--max-memory-mb", "999999999"), 1, "Insufficient memory"),
+        ],
+        ids=["basic-valid", "shows-config-memory", "shows-performance", "insufficient-memory"],
+    )
+    def test_edge_config_rich_output(
+        self,
+        runner: CliRunner,
+        args: tuple[str, ...],
+        expect_exit: int,
+        expect_substr: str,
+    ) -> None:
+        result = runner.invoke(cli, ["edge-config", *args])
+        assert result.exit_code == expect_exit
+        assert expect_substr in result.output
+
+    def test_edge_config_json_output_shape(self, json_invoke: JsonInvoke) -> None:
+        _, data = json_invoke(("edge-config", "--max-memory-mb", "512"))
+        assert data.keys() >= _EDGE_CONFIG_KEYS
         assert "is_valid" in data["validation"]
-        assert "tokens_per_second" in data["performance_estimate"]
-        assert "max_context_tokens" in data["performance_estimate"]
+        assert data["performance_estimate"].keys() >= _PERFORMANCE_ESTIMATE_KEYS
 
     def test_edge_config_json_insufficient_memory_exits_nonzero(
-        self, runner: CliRunner
+        self, json_invoke: JsonInvoke
     ) -> None:
-        # Requesting more memory than any real system has
-        result = runner.invoke(
-            cli,
-            [
-                "edge-config",
-                "--max-memory-mb", "999999999",
-                "--json-output",
-            ],
-        )
-        data = json.loads(result.output)
+        # Requesting more memory than the patched host has
+        result, data = json_invoke(("edge-config", "--max-memory-mb", "999999999"))
         assert data["validation"]["is_valid"] is False
         assert result.exit_code == 1
 
-    def test_edge_config_with_quantization(self, runner: CliRunner) -> None:
-        result = runner.invoke(
-            cli,
-            [
+    def test_edge_config_with_quantization(self, json_invoke: JsonInvoke) -> None:
+        _, data = json_invoke(
+            (
                 "edge-config",
                 "--max-memory-mb", "512",
                 "--quantization", "gguf_q4_k_m",
-                "--json-output",
-            ],
+            )
         )
-        data = json.loads(result.output)
         assert data["performance_estimate"]["quantization_speedup_factor"] == 2.0
 
-    def test_edge_config_with_gpu_memory(self, runner: CliRunner) -> None:
-        result = runner.invoke(
-            cli,
-            [
+    def test_edge_config_with_gpu_memory(self, json_invoke: JsonInvoke) -> None:
+        _, data = json_invoke(
+            (
                 "edge-config",
                 "--max-memory-mb", "512",
                 "--gpu-memory-mb", "8192",
-                "--json-output",
-            ],
+            )
         )
-        data = json.loads(result.output)
-        assert data["performance_estimate"]["notes"]
-        assert any("GPU" in n for n in data["performance_estimate"]["notes"])
+        assert "GPU" in " ".join(data["performance_estimate"]["notes"])
 
-    def test_edge_config_offline_capable_flag(self, runner: CliRunner) -> None:
-        result = runner.invoke(
-            cli,
-            [
-                "edge-config",
-                "--max-memory-mb", "4096",
-                "--offline-capable",
-                "--json-output",
-            ],
-        )
-        data = json.loads(result.output)
+    def test_edge_config_offline_capable_flag(self, json_invoke: JsonInvoke) -> None:
+        _, data = json_invoke(("edge-config", "--max-memory-mb", "4096", "--offline-capable"))
         assert "validation" in data
 
-    def test_edge_config_rich_output_shows_config_memory(
-        self, runner: CliRunner
-    ) -> None:
-        result = runner.invoke(
-            cli,
-            ["edge-config", "--max-memory-mb", "4096"],
-        )
-        assert "4096" in result.output
-
-    def test_edge_config_rich_output_shows_performance_section(
-        self, runner: CliRunner
-    ) -> None:
-        result = runner.invoke(
-            cli,
-            ["edge-config", "--max-memory-mb", "4096", "--model-size-b", "7.0"],
-        )
-        assert "Performance Estimate" in result.output
-
-    def test_edge_config_errors_shown_when_invalid(
-        self, runner: CliRunner
-    ) -> None:
-        result = runner.invoke(
-            cli,
-            ["edge-config", "--max-memory-mb", "999999999"],
-        )
-        assert result.exit_code == 1
-        assert "Errors" in result.output or "Insufficient" in result.output
-
-    def test_edge_config_json_performance_estimate_fields(
-        self, runner: CliRunner
-    ) -> None:
-        result = runner.invoke(
-            cli,
-            [
+    def test_edge_config_json_performance_estimate_fields(self, json_invoke: JsonInvoke) -> None:
+        _, data = json_invoke(
+            (
                 "edge-config",
                 "--max-memory-mb", "512",
                 "--model-size-b", "7.0",
                 "--max-concurrent-requests", "2",
-                "--json-output",
-            ],
+            )
         )
-        data = json.loads(result.output)
-        pe = data["performance_estimate"]
-        assert "time_to_first_token_ms" in pe
-        assert "quantization_speedup_factor" in pe
-        assert "notes" in pe
+        assert data["performance_estimate"].keys() >= _PERFORMANCE_ESTIMATE_KEYS
 
-    def test_edge_config_notes_shown_when_model_oversized(
-        self, runner: CliRunner
-    ) -> None:
-        result = runner.invoke(
-            cli,
-            [
+    def test_edge_config_notes_shown_when_model_oversized(self, json_invoke: JsonInvoke) -> None:
+        _, data = json_invoke(
+            (
                 "edge-config",
                 "--max-memory-mb", "512",
                 "--model-size-b", "70.0",
-                "--json-output",
-            ],
+            )
         )
-        data = json.loads(result.output)
-        notes = data["performance_estimate"]["notes"]
-        assert any("exceeds" in n for n in notes)
+        assert "exceeds" in " ".join(data["performance_estimate"]["notes"])
 
+    @pytest.mark.parametrize(
+        "quant", ["none", "int8", "int4", "gguf_q4_k_m", "gguf_q5_k_m", "gguf_q8_0"]
+    )
     def test_edge_config_all_quantization_choices(
-        self, runner: CliRunner
+        self, json_invoke: JsonInvoke, quant: str
     ) -> None:
-        for quant in ["none", "int8", "int4", "gguf_q4_k_m", "gguf_q5_k_m", "gguf_q8_0"]:
-            result = runner.invoke(
-                cli,
-                [
-                    "edge-config",
-                    "--max-memory-mb", "512",
-                    "--quantization", quant,
-                    "--json-output",
-                ],
-            )
-            assert result.exit_code in (0, 1), f"Unexpected exit for quant={quant}"
-            data = json.loads(result.output)
-            assert "performance_estimate" in data
+        # gguf_q4_k_m shares its cached run with test_edge_config_with_quantization.
+        result, data = json_invoke(
+            ("edge-config", "--max-memory-mb", "512", "--quantization", quant)
+        )
+        assert result.exit_code == 0, f"Unexpected exit for quant={quant}"
+        assert "performance_estimate" in data
@@ -44,6 +44,14 @@ def _make_config(
     )
 
 
+# Check IDs that have a dedicated remediation message.
+_KNOWN_CHECKS = (
+    "data_residency", "network_isolation", "encryption_at_rest",
+    "encryption_in_transit", "key_management", "audit_logging",
+    "air_gap", "tpm", "fips_hardware",
+)
+
+
 def _eu_gdpr_policy() -> DataResidencyPolicy:
     return DataResidencyPolicy(
         policy_id="eu-gdpr",
@@ -151,24 +159,44 @@ class TestCheckerConstruction:
 # SovereigntyComplianceChecker.check — basic behaviour
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="module")
+def default_checker() -> SovereigntyComplianceChecker:
+    # check() keeps no state between calls, so tests without residency
+    # policies share one checker and its default validator and mapper.
+    return SovereigntyComplianceChecker()
+
+
+@pytest.fixture(scope="module")
+def reports_by_region(
+    default_checker: SovereigntyComplianceChecker,
+) -> dict[str, ComplianceReport]:
+    """Check the default L1 config once per region; tests only read the reports."""
+    return {
+        region: default_checker.check(_make_config(region=region))
+        for region in ("DE", "UNKNOWN_REGION_XYZ", "ZZZZZ", "US")
+    }
+
+
 class TestCheckerCheck:
-    def test_l1_simple_config_returns_report(self) -> None:
-        checker = SovereigntyComplianceChecker()
+    def test_l1_simple_config_returns_report(
+        self, default_checker: SovereigntyComplianceChecker
+    ) -> None:
         config = _make_config()
-        report = checker.check(config, deployment_id="deploy-001")
+        report = default_checker.check(config, deployment_id="deploy-001")
         assert report.deployment_id == "deploy-001"
         assert report.sovereignty_level == SovereigntyLevel.L1_CLOUD
         assert isinstance(report.assessed_at, str)
 
-    def test_report_has_metadata(self) -> None:
-        checker = SovereigntyComplianceChecker()
-        config = _make_config()
-        report = checker.check(config)
+    def test_report_has_metadata(
+        self, reports_by_region: dict[str, ComplianceReport]
+    ) -> None:
+        report = reports_by_region["US"]
         assert "checked_policies" in report.metadata
         assert "validation_checks_run" in report.metadata
 
-    def test_compliant_l1_cloud_config(self) -> None:
-        checker = SovereigntyComplianceChecker()
+    def test_compliant_l1_cloud_config(
+        self, default_checker: SovereigntyComplianceChecker
+    ) -> None:
         config = _make_config(
             level=SovereigntyLevel.L1_CLOUD,
             region="US",
@@ -178,7 +206,7 @@ class TestCheckerCheck:
             key_mgmt="provider_managed",
             audit=True,
         )
-        report = checker.check(config)
+        report = default_checker.check(config)
         assert report.overall_status in (
             ComplianceStatus.COMPLIANT, ComplianceStatus.PARTIAL
         )
@@ -192,8 +220,7 @@ class TestCheckerCheck:
         config = _make_config(region="US")
         report = checker.check(config)
         # residency check should pass
-        residency_checks = [c for c in report.passed_checks if "residency" in c]
-        assert len(residency_checks) >= 1
+        assert "residency.us-only" in report.passed_checks
 
     def test_residency_policy_fail_with_blocked_region(self) -> None:
         policy = DataResidencyPolicy(
@@ -241,74 +268,75 @@ class TestCheckerCheck:
             audit_logging_enabled=True,
         )
         report = checker.check(config)
-        residency_passed = [c for c in report.passed_checks if "residency" in c]
-        assert len(residency_passed) >= 1
+        assert "residency.open" in report.passed_checks
 
-    def test_additional_policies_applied(self) -> None:
-        checker = SovereigntyComplianceChecker()
+    def test_additional_policies_applied(
+        self, default_checker: SovereigntyComplianceChecker
+    ) -> None:
         extra_policy = DataResidencyPolicy(
             policy_id="extra-us",
             allowed_regions=["US"],
         )
         config = _make_config(region="US")
-        report = checker.check(config, additional_policies=[extra_policy])
+        report = default_checker.check(config, additional_policies=[extra_policy])
         assert "residency.extra-us" in report.passed_checks
 
-    def test_l5_without_isolation_fails(self) -> None:
-        checker = SovereigntyComplianceChecker()
+    def test_l5_without_isolation_fails(
+        self, default_checker: SovereigntyComplianceChecker
+    ) -> None:
         config = _make_config(
             level=SovereigntyLevel.L5_FULLY_LOCAL,
             network_isolated=False,
             air_gapped=False,
         )
-        report = checker.check(config)
-        assert any("l5_plus" in f for f in report.failed_checks)
+        report = default_checker.check(config)
+        assert "l5_plus" in " ".join(report.failed_checks)
 
-    def test_l5_with_network_isolation_passes_level_check(self) -> None:
-        checker = SovereigntyComplianceChecker()
+    def test_l5_with_network_isolation_passes_level_check(
+        self, default_checker: SovereigntyComplianceChecker
+    ) -> None:
         config = _make_config(
             level=SovereigntyLevel.L5_FULLY_LOCAL,
             network_isolated=True,
             air_gapped=False,
         )
-        report = checker.check(config)
+        report = default_checker.check(config)
         assert "level.l5_plus.network" in report.passed_checks
 
-    def test_l5_with_air_gap_passes_level_check(self) -> None:
-        checker = SovereigntyComplianceChecker()
+    def test_l5_with_air_gap_passes_level_check(
+        self, default_checker: SovereigntyComplianceChecker
+    ) -> None:
         config = _make_config(
             level=SovereigntyLevel.L5_FULLY_LOCAL,
             network_isolated=False,
             air_gapped=True,
         )
-        report = checker.check(config)
+        report = default_checker.check(config)
         assert "level.l5_plus.network" in report.passed_checks
 
-    def test_jurisdiction_summary_populated_for_known_region(self) -> None:
-        checker = SovereigntyComplianceChecker()
-        config = _make_config(region="DE")
-        report = checker.check(config)
-        assert len(report.jurisdiction_summary) > 0
+    def test_jurisdiction_summary_populated_for_known_region(
+        self, reports_by_region: dict[str, ComplianceReport]
+    ) -> None:
+        assert len(reports_by_region["DE"].jurisdiction_summary) > 0
 
-    def test_unknown_region_produces_warning_about_jurisdiction(self) -> None:
-        checker = SovereigntyComplianceChecker()
-        config = _make_config(region="UNKNOWN_REGION_XYZ")
-        report = checker.check(config)
-        assert any("jurisdiction" in w.lower() or "UNKNOWN_REGION_XYZ" in w for w in report.warnings)
+    def test_unknown_region_produces_warning_about_jurisdiction(
+        self, reports_by_region: dict[str, ComplianceReport]
+    ) -> None:
+        warnings = " ".join(reports_by_region["UNKNOWN_REGION_XYZ"].warnings)
+        assert "jurisdiction" in warnings.lower() or "UNKNOWN_REGION_XYZ" in warnings
 
-    def test_warnings_only_status_is_partial(self) -> None:
-        checker = SovereigntyComplianceChecker()
+    def test_warnings_only_status_is_partial(
+        self, reports_by_region: dict[str, ComplianceReport]
+    ) -> None:
         # Use a region that triggers a jurisdiction warning but no failures
-        config = _make_config(region="ZZZZZ")
-        report = checker.check(config)
+        report = reports_by_region["ZZZZZ"]
         # Should be PARTIAL (warnings, no hard failures)
         assert report.overall_status in (ComplianceStatus.PARTIAL, ComplianceStatus.COMPLIANT)
 
-    def test_deployment_id_default_is_unknown(self) -> None:
-        checker = SovereigntyComplianceChecker()
-        config = _make_config()
-        report = checker.check(config)
-        assert report.deployment_id == "unknown"
+    def test_deployment_id_default_is_unknown(
+        self, reports_by_region: dict[str, ComplianceReport]
+    ) -> None:
+        assert reports_by_region["US"].deployment_id == "unknown"
 
 
 # ---------------------------------------------------------------------------
@@ -352,12 +380,26 @@ class TestStaticHelpers:
         remediation = SovereigntyComplianceChecker._remediation_for_check("mystery_check")
         assert "mystery_check" in remediation
 
-    def test_remediation_for_all_known_checks(self) -> None:
-        known = [
-            "data_residency", "network_isolation", "encryption_at_rest",
-            "encryption_in_transit", "key_management", "audit_logging",
-            "air_gap", "tpm", "fips_hardware",
-        ]
-        for check in known:
-            result = SovereigntyComplianceChecker._remediation_for_check(check)
-            assert isinstance(result, str) and len(result) > 0
+    @pytest.mark.parametrize("check", _KNOWN_CHECKS)
+    def test_remediation_for_all_known_checks(self, check: str) -> None:
+        result = SovereigntyComplianceChecker._remediation_for_check(check)
+        assert isinstance(result, str) and len(result) > 0
+
+    def test_remediation_is_memoised_per_check(self) -> None:
+        helper = SovereigntyComplianceChecker._remediation_for_check
+        helper.cache_clear()
+        first = helper("tpm")
+        assert helper("tpm") is first
+        info = helper.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_severity_is_memoised_per_check_and_level(self) -> None:
+        helper = SovereigntyComplianceChecker._severity_for_check
+        helper.cache_clear()
+        helper("air_gap", SovereigntyLevel.L1_CLOUD)
+        helper("air_gap", SovereigntyLevel.L4_LOCAL_AUGMENTED)
+        helper("air_gap", SovereigntyLevel.L1_CLOUD)
+        info = helper.cache_info()
+        assert info.misses == 2
+        assert info.hits == 1